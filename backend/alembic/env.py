@@ -14,6 +14,10 @@ from app.models.user import User
 from app.models.onboarding import OnboardingData
 from app.models.quiz import QuizQuestion, QuizAnswer, QuizSubmission
 from app.models.career import CareerRecommendation, SkillGap, LearningRoadmap
+from app.models.learning import LearningMaterial
+from app.models.job import RecommendationJob
+from app.models.cache import LLMResponseCache
+from app.models.stats import AdminStatsSummary
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,43 @@
+"""add recommendation jobs table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'recommendation_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('force_regenerate', sa.Boolean(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recommendation_jobs_id'), 'recommendation_jobs', ['id'], unique=False)
+    # Workers poll for the oldest queued job
+    op.create_index('ix_recommendation_jobs_status_created_at', 'recommendation_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recommendation_jobs_status_created_at', table_name='recommendation_jobs')
+    op.drop_index(op.f('ix_recommendation_jobs_id'), table_name='recommendation_jobs')
+    op.drop_table('recommendation_jobs')
@@ -0,0 +1,54 @@
+"""add composite indexes for per-user hot queries
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the latest answer per (user, question) before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM quiz_answers a
+        USING quiz_answers b
+        WHERE a.user_id = b.user_id
+          AND a.question_id = b.question_id
+          AND a.id < b.id
+        """
+    )
+    op.create_index('ix_quiz_answers_user_id_question_id', 'quiz_answers', ['user_id', 'question_id'], unique=True)
+    op.create_index('ix_quiz_submissions_user_id_created_at', 'quiz_submissions', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_career_recommendations_user_id_match_score', 'career_recommendations', ['user_id', 'match_score'], unique=False)
+    op.create_index('ix_skill_gaps_career_recommendation_id', 'skill_gaps', ['career_recommendation_id'], unique=False)
+    op.create_index('ix_learning_roadmaps_career_recommendation_id_order', 'learning_roadmaps', ['career_recommendation_id', 'order'], unique=False)
+    op.create_index(
+        'ix_quiz_questions_active_field_section_order', 'quiz_questions',
+        ['field_of_study', 'section', 'order'], unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+    op.create_index(
+        'ix_learning_materials_active_created_at', 'learning_materials',
+        ['created_at'], unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_learning_materials_active_created_at', table_name='learning_materials')
+    op.drop_index('ix_quiz_questions_active_field_section_order', table_name='quiz_questions')
+    op.drop_index('ix_learning_roadmaps_career_recommendation_id_order', table_name='learning_roadmaps')
+    op.drop_index('ix_skill_gaps_career_recommendation_id', table_name='skill_gaps')
+    op.drop_index('ix_career_recommendations_user_id_match_score', table_name='career_recommendations')
+    op.drop_index('ix_quiz_submissions_user_id_created_at', table_name='quiz_submissions')
+    op.drop_index('ix_quiz_answers_user_id_question_id', table_name='quiz_answers')
@@ -0,0 +1,27 @@
+"""add section answer counts to quiz submissions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+Existing submissions keep NULL counters and are recounted on their next
+answer; run python -m app.reconcile_quiz_progress to backfill them eagerly.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('quiz_submissions', sa.Column('section_answer_counts', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('quiz_submissions', 'section_answer_counts')
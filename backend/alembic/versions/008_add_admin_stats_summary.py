@@ -0,0 +1,43 @@
+"""add admin stats summary table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'admin_stats_summary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('total_users', sa.Integer(), nullable=False),
+        sa.Column('active_users', sa.Integer(), nullable=False),
+        sa.Column('completed_onboarding', sa.Integer(), nullable=False),
+        sa.Column('completed_quiz', sa.Integer(), nullable=False),
+        sa.Column('total_learning_materials', sa.Integer(), nullable=False),
+        sa.Column('total_recommendations', sa.Integer(), nullable=False),
+        sa.Column('total_quiz_questions', sa.Integer(), nullable=False),
+        sa.Column('users_by_field', sa.JSON(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Seed the single row so refreshing processes only ever update it
+    op.execute(
+        "INSERT INTO admin_stats_summary (id, total_users, active_users, completed_onboarding, "
+        "completed_quiz, total_learning_materials, total_recommendations, total_quiz_questions, "
+        "users_by_field, refreshed_at) VALUES (1, 0, 0, 0, 0, 0, 0, 0, '{}', NULL)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('admin_stats_summary')
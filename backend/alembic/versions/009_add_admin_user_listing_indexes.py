@@ -0,0 +1,26 @@
+"""add indexes for the admin user listing
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_onboarding_data_field_of_study'), 'onboarding_data', ['field_of_study'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_onboarding_data_field_of_study'), table_name='onboarding_data')
+    op.drop_index('ix_users_created_at_id', table_name='users')
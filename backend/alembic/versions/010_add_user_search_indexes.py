@@ -0,0 +1,43 @@
+"""add pg_trgm and prefix indexes for admin user search
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Substring (ILIKE '%term%') and similarity (%) matches
+    op.create_index(
+        'ix_users_email_trgm', 'users', ['email'], unique=False,
+        postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_users_full_name_trgm', 'users', ['full_name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'}
+    )
+    # Prefix matches for terms too short for trigrams
+    op.execute("CREATE INDEX ix_users_email_lower_prefix ON users (lower(email) text_pattern_ops)")
+    op.execute("CREATE INDEX ix_users_full_name_lower_prefix ON users (lower(full_name) text_pattern_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_users_full_name_lower_prefix', table_name='users')
+    op.drop_index('ix_users_email_lower_prefix', table_name='users')
+    op.drop_index('ix_users_full_name_trgm', table_name='users')
+    op.drop_index('ix_users_email_trgm', table_name='users')
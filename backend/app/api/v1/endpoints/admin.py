@@ -1,13 +1,13 @@
 from typing import List, Optional
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, ReadSessionLocal
 from app.core.dependencies import get_current_admin_user, get_current_active_user
+from app.core.user_cache import UserSnapshot
 from app.models.user import User
-from app.models.quiz import QuizQuestion, QuizSubmission
-from app.models.career import CareerRecommendation
-from app.models.onboarding import OnboardingData
+from app.models.quiz import QuizQuestion
 from app.models.learning import LearningMaterial
 from app.schemas.quiz import QuizQuestionCreate, QuizQuestionUpdate, QuizQuestionResponse
 from app.schemas.admin import (
@@ -19,31 +19,30 @@ from app.schemas.admin import (
     LearningMaterialListResponse,
     AdminDashboardStats
 )
+from app.services.quiz_catalog import quiz_catalog
+from app.services.stats_service import StatsService
+from app.services.admin_user_service import AdminUserService, UserExporter
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 @router.get("/analytics")
 def get_analytics(
-    admin_user: User = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
+    db: Session = Depends(get_read_db)
 ):
     """Get basic platform analytics"""
-    total_users = db.query(func.count(User.id)).scalar()
-    total_recommendations = db.query(func.count(CareerRecommendation.id)).scalar()
-    total_questions = db.query(func.count(QuizQuestion.id)).filter(
-        QuizQuestion.is_active == True
-    ).scalar()
+    stats = StatsService.get_summary(db)
     
     return {
-        "total_users": total_users,
-        "total_recommendations": total_recommendations,
-        "total_quiz_questions": total_questions,
-        "active_users": db.query(func.count(User.id)).filter(User.is_active == True).scalar()
+        "total_users": stats["total_users"],
+        "total_recommendations": stats["total_recommendations"],
+        "total_quiz_questions": stats["total_quiz_questions"],
+        "active_users": stats["active_users"]
     }
 
 @router.get("/quiz-questions", response_model=List[QuizQuestionResponse])
 def get_all_quiz_questions(
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Get all quiz questions (including inactive)"""
@@ -53,7 +52,7 @@ def get_all_quiz_questions(
 @router.post("/quiz-questions", response_model=QuizQuestionResponse, status_code=status.HTTP_201_CREATED)
 def create_quiz_question(
     question: QuizQuestionCreate,
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Create a new quiz question"""
@@ -61,13 +60,14 @@ def create_quiz_question(
     db.add(db_question)
     db.commit()
     db.refresh(db_question)
+    quiz_catalog.bump_version()
     return QuizQuestionResponse.from_orm(db_question)
 
 @router.put("/quiz-questions/{question_id}", response_model=QuizQuestionResponse)
 def update_quiz_question(
     question_id: int,
     question_update: QuizQuestionUpdate,
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Update a quiz question"""
@@ -84,12 +84,13 @@ def update_quiz_question(
     
     db.commit()
     db.refresh(db_question)
+    quiz_catalog.bump_version()
     return QuizQuestionResponse.from_orm(db_question)
 
 @router.delete("/quiz-questions/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_quiz_question(
     question_id: int,
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Delete a quiz question (soft delete - mark as inactive)"""
@@ -103,11 +104,12 @@ def delete_quiz_question(
     
     db_question.is_active = False
     db.commit()
+    quiz_catalog.bump_version()
     return None
 
 @router.get("/users")
 def get_all_users(
-    admin_user: User = Depends(get_current_admin_user),
+    admin_user: UserSnapshot = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """Get all users (admin only)"""
@@ -118,42 +120,20 @@ def get_all_users(
 # Enhanced Dashboard Stats
 @router.get("/stats", response_model=AdminDashboardStats)
 def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    db: Session = Depends(get_read_db),
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Get admin dashboard statistics"""
-    total_users = db.query(func.count(User.id)).scalar()
-    active_users = db.query(func.count(User.id)).filter(User.is_active == True).scalar()
-    
-    completed_onboarding = db.query(func.count(OnboardingData.id)).filter(
-        OnboardingData.is_completed == True
-    ).scalar()
-    
-    completed_quiz = db.query(func.count(QuizSubmission.id)).filter(
-        QuizSubmission.is_completed == True
-    ).scalar()
-    
-    total_learning_materials = db.query(func.count(LearningMaterial.id)).filter(
-        LearningMaterial.is_active == True
-    ).scalar()
-    
-    # Users by field of study
-    field_counts = db.query(
-        OnboardingData.field_of_study,
-        func.count(OnboardingData.id)
-    ).filter(
-        OnboardingData.field_of_study != None
-    ).group_by(OnboardingData.field_of_study).all()
-    
-    users_by_field = {field: count for field, count in field_counts if field}
+    stats = StatsService.get_summary(db)
     
     return AdminDashboardStats(
-        total_users=total_users or 0,
-        active_users=active_users or 0,
-        completed_onboarding=completed_onboarding or 0,
-        completed_quiz=completed_quiz or 0,
-        total_learning_materials=total_learning_materials or 0,
-        users_by_field=users_by_field
+        total_users=stats["total_users"],
+        active_users=stats["active_users"],
+        completed_onboarding=stats["completed_onboarding"],
+        completed_quiz=stats["completed_quiz"],
+        total_learning_materials=stats["total_learning_materials"],
+        users_by_field=stats["users_by_field"],
+        refreshed_at=stats["refreshed_at"]
     )
 
 
@@ -164,63 +144,48 @@ def get_detailed_users(
     per_page: int = Query(20, ge=1, le=100),
     field_of_study: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
+    db: Session = Depends(get_read_db),
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Get all users with their onboarding data"""
-    query = db.query(User)
-    
-    # Filter by search term (email or name)
-    if search:
-        query = query.filter(
-            (User.email.ilike(f"%{search}%")) |
-            (User.full_name.ilike(f"%{search}%"))
-        )
-    
-    # Get total count before pagination
-    total = query.count()
-    
-    # Paginate
-    users = query.offset((page - 1) * per_page).limit(per_page).all()
-    
-    # Build response with onboarding data
-    user_responses = []
-    for user in users:
-        onboarding = db.query(OnboardingData).filter(OnboardingData.user_id == user.id).first()
-        quiz = db.query(QuizSubmission).filter(
-            QuizSubmission.user_id == user.id,
-            QuizSubmission.is_completed == True
-        ).first()
-        
-        # Filter by field of study if specified
-        if field_of_study:
-            if not onboarding or onboarding.field_of_study != field_of_study:
-                continue
-        
-        user_response = UserAdminResponse(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            is_active=user.is_active,
-            is_admin=(user.role == "admin"),
-            created_at=user.created_at,
-            field_of_study=onboarding.field_of_study if onboarding else None,
-            education_level=onboarding.education_level if onboarding else None,
-            institution=onboarding.institution if onboarding else None,
-            interests=onboarding.interests if onboarding else None,
-            technical_skills=onboarding.technical_skills if onboarding else None,
-            soft_skills=onboarding.soft_skills if onboarding else None,
-            career_goals=onboarding.career_goals if onboarding else None,
-            onboarding_completed=onboarding.is_completed if onboarding else False,
-            quiz_completed=quiz is not None
-        )
-        user_responses.append(user_response)
+    users, total, next_cursor = AdminUserService.list_users(
+        db, per_page, field_of_study=field_of_study, search=search, cursor=cursor, page=page
+    )
     
     return UserListResponse(
-        users=user_responses,
+        users=users,
         total=total,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/users/export")
+def export_users(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    field_of_study: Optional[str] = None,
+    search: Optional[str] = None,
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
+):
+    """Stream all users with onboarding and quiz data as CSV or NDJSON"""
+    def export_stream():
+        # The request's session is closed before the body streams, so the
+        # export reads through its own (replica when configured) session
+        export_db = ReadSessionLocal()
+        try:
+            exporter = UserExporter(export_db, field_of_study=field_of_study, search=search)
+            yield from exporter.iter_csv() if export_format == "csv" else exporter.iter_ndjson()
+        finally:
+            export_db.close()
+    
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"users-{datetime.utcnow():%Y%m%d-%H%M%S}.{export_format}"
+    return StreamingResponse(
+        export_stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
     )
 
 
@@ -228,39 +193,10 @@ def get_detailed_users(
 def get_user_detail(
     user_id: int,
     db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Get detailed user information"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    onboarding = db.query(OnboardingData).filter(OnboardingData.user_id == user.id).first()
-    quiz = db.query(QuizSubmission).filter(
-        QuizSubmission.user_id == user.id,
-        QuizSubmission.is_completed == True
-    ).first()
-    
-    return UserAdminResponse(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        is_active=user.is_active,
-        is_admin=(user.role == "admin"),
-        created_at=user.created_at,
-        field_of_study=onboarding.field_of_study if onboarding else None,
-        education_level=onboarding.education_level if onboarding else None,
-        institution=onboarding.institution if onboarding else None,
-        interests=onboarding.interests if onboarding else None,
-        technical_skills=onboarding.technical_skills if onboarding else None,
-        soft_skills=onboarding.soft_skills if onboarding else None,
-        career_goals=onboarding.career_goals if onboarding else None,
-        onboarding_completed=onboarding.is_completed if onboarding else False,
-        quiz_completed=quiz is not None
-    )
+    return AdminUserService.get_user(db, user_id)
 
 
 # Learning Materials Management
@@ -272,7 +208,7 @@ def get_all_learning_materials(
     field_of_study: Optional[str] = None,
     is_active: Optional[bool] = None,
     db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Get all learning materials"""
     query = db.query(LearningMaterial)
@@ -304,7 +240,7 @@ def get_all_learning_materials(
 def create_learning_material(
     material: LearningMaterialCreate,
     db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Create a new learning material"""
     db_material = LearningMaterial(
@@ -323,7 +259,7 @@ def update_learning_material(
     material_id: int,
     material: LearningMaterialUpdate,
     db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Update a learning material"""
     db_material = db.query(LearningMaterial).filter(LearningMaterial.id == material_id).first()
@@ -346,7 +282,7 @@ def update_learning_material(
 def delete_learning_material(
     material_id: int,
     db: Session = Depends(get_db),
-    admin_user: User = Depends(get_current_admin_user)
+    admin_user: UserSnapshot = Depends(get_current_admin_user)
 ):
     """Delete a learning material"""
     db_material = db.query(LearningMaterial).filter(LearningMaterial.id == material_id).first()
@@ -367,8 +303,8 @@ def get_public_learning_materials(
     category: Optional[str] = None,
     field_of_study: Optional[str] = None,
     level: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: Session = Depends(get_read_db),
+    current_user: UserSnapshot = Depends(get_current_active_user)
 ):
     """Get active learning materials for users"""
     query = db.query(LearningMaterial).filter(LearningMaterial.is_active == True)
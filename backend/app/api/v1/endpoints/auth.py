@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, get_async_db
 from app.core.dependencies import get_current_active_user
 from app.core.security import verify_token
+from app.core.user_cache import UserSnapshot
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse, RefreshTokenRequest
 from app.services.auth_service import AuthService
@@ -11,9 +13,9 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
-    user = AuthService.create_user(db, user_data)
+    user = await AuthService.create_user(db, user_data)
     tokens = AuthService.generate_tokens(user)
     
     return TokenResponse(
@@ -23,9 +25,9 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
 @router.post("/login", response_model=TokenResponse)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login user"""
-    user = AuthService.authenticate_user(db, credentials.email, credentials.password)
+    user = await AuthService.authenticate_user(db, credentials.email, credentials.password)
     
     if not user:
         raise HTTPException(
@@ -76,6 +78,6 @@ def refresh_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
     )
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+def get_current_user_info(current_user: UserSnapshot = Depends(get_current_active_user)):
     """Get current user information"""
     return UserResponse.from_orm(current_user)
@@ -1,60 +1,110 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from starlette.concurrency import run_in_threadpool
+from app.core.database import get_db, get_async_db, get_async_read_db, SessionLocal
 from app.core.dependencies import get_current_active_user
-from app.models.user import User
-from app.models.career import CareerRecommendation, SkillGap, LearningRoadmap
+from app.core.user_cache import UserSnapshot
+from app.models.career import CareerRecommendation
 from app.schemas.career import (
     CareerRecommendationResponse,
     CareerRecommendationDetailResponse,
     SkillGapResponse,
     LearningRoadmapResponse,
-    GenerateRecommendationsRequest
+    GenerateRecommendationsRequest,
+    RecommendationJobResponse
 )
 from app.services.gemini_service import GeminiService
+from app.services.job_service import JobService
+from app.services.career_service import CareerService
 
 router = APIRouter(prefix="/careers", tags=["Career Recommendations"])
 
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
 @router.post("/generate", response_model=List[CareerRecommendationResponse])
-def generate_recommendations(
+async def generate_recommendations(
     request: GenerateRecommendationsRequest = GenerateRecommendationsRequest(),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Generate career recommendations using AI"""
-    # Check if recommendations already exist
-    existing = db.query(CareerRecommendation).filter(
-        CareerRecommendation.user_id == current_user.id
-    ).first()
-    
-    if existing and not request.force_regenerate:
-        # Return existing recommendations
-        recommendations = db.query(CareerRecommendation).filter(
-            CareerRecommendation.user_id == current_user.id
-        ).all()
-        return [CareerRecommendationResponse.from_orm(r) for r in recommendations]
+    recommendations = await run_in_threadpool(
+        GeminiService.get_or_clear_recommendations, db, current_user.id, request.force_regenerate
+    )
     
-    # Delete existing recommendations if force regenerate
-    if existing and request.force_regenerate:
-        db.query(CareerRecommendation).filter(
-            CareerRecommendation.user_id == current_user.id
-        ).delete()
-        db.commit()
+    if not recommendations:
+        # Generate new recommendations
+        recommendations = await GeminiService.generate_career_recommendations_async(db, current_user)
     
-    # Generate new recommendations
-    recommendations = GeminiService.generate_career_recommendations(db, current_user)
     return [CareerRecommendationResponse.from_orm(r) for r in recommendations]
 
-@router.get("", response_model=List[CareerRecommendationResponse])
-def get_recommendations(
-    current_user: User = Depends(get_current_active_user),
+@router.get("/generate/stream")
+async def stream_recommendations(
+    force_regenerate: bool = Query(False),
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Generate career recommendations and stream each one as a server-sent event"""
+    existing = await run_in_threadpool(
+        GeminiService.get_or_clear_recommendations, db, current_user.id, force_regenerate
+    )
+    
+    async def event_stream():
+        if existing:
+            for recommendation in existing:
+                yield _sse_event("recommendation", CareerRecommendationResponse.from_orm(recommendation).model_dump_json())
+        else:
+            # The request session is closed before the body streams, so use our own
+            stream_db = SessionLocal()
+            try:
+                async for recommendation in GeminiService.stream_career_recommendations(stream_db, current_user):
+                    yield _sse_event("recommendation", CareerRecommendationResponse.from_orm(recommendation).model_dump_json())
+            finally:
+                await run_in_threadpool(stream_db.close)
+        yield _sse_event("done", "{}")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/generate/jobs", response_model=RecommendationJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_recommendations(
+    request: GenerateRecommendationsRequest = GenerateRecommendationsRequest(),
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Queue career recommendation generation and return the job immediately"""
+    job = JobService.enqueue_recommendation_job(db, current_user.id, request.force_regenerate)
+    return RecommendationJobResponse.from_orm(job)
+
+@router.get("/jobs/{job_id}", response_model=RecommendationJobResponse)
+def get_recommendation_job(
+    job_id: int,
+    current_user: UserSnapshot = Depends(get_current_active_user),
     db: Session = Depends(get_db)
+):
+    """Get the status of a recommendation generation job"""
+    job = JobService.get_job(db, current_user.id, job_id)
+    return RecommendationJobResponse.from_orm(job)
+
+@router.get("", response_model=List[CareerRecommendationResponse])
+async def get_recommendations(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get all career recommendations for current user"""
-    recommendations = db.query(CareerRecommendation).filter(
-        CareerRecommendation.user_id == current_user.id
-    ).order_by(CareerRecommendation.match_score.desc()).all()
+    recommendations = (await db.scalars(
+        select(CareerRecommendation).filter(
+            CareerRecommendation.user_id == current_user.id
+        ).order_by(CareerRecommendation.match_score.desc())
+    )).all()
     
     if not recommendations:
         raise HTTPException(
@@ -64,72 +114,51 @@ def get_recommendations(
     
     return [CareerRecommendationResponse.from_orm(r) for r in recommendations]
 
-@router.get("/{career_id}", response_model=CareerRecommendationDetailResponse)
-def get_career_detail(
-    career_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+@router.get("/full", response_model=List[CareerRecommendationDetailResponse])
+async def get_recommendations_with_details(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get detailed information about a specific career recommendation"""
-    career = db.query(CareerRecommendation).filter(
-        CareerRecommendation.id == career_id,
-        CareerRecommendation.user_id == current_user.id
-    ).first()
+    """Get all career recommendations for current user with skill gaps and roadmaps"""
+    recommendations = await CareerService.get_recommendations_with_details(db, current_user.id)
     
-    if not career:
+    if not recommendations:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Career recommendation not found"
+            detail="No recommendations found. Please generate recommendations first."
         )
     
+    return [CareerRecommendationDetailResponse.from_orm(r) for r in recommendations]
+
+@router.get("/{career_id}", response_model=CareerRecommendationDetailResponse)
+async def get_career_detail(
+    career_id: int,
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get detailed information about a specific career recommendation"""
+    career = await CareerService.get_recommendation(
+        db, current_user.id, career_id,
+        CareerRecommendation.skill_gaps, CareerRecommendation.learning_roadmaps
+    )
     return CareerRecommendationDetailResponse.from_orm(career)
 
 @router.get("/{career_id}/skill-gaps", response_model=List[SkillGapResponse])
-def get_skill_gaps(
+async def get_skill_gaps(
     career_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get skill gaps for a specific career"""
-    # Verify career belongs to user
-    career = db.query(CareerRecommendation).filter(
-        CareerRecommendation.id == career_id,
-        CareerRecommendation.user_id == current_user.id
-    ).first()
-    
-    if not career:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Career recommendation not found"
-        )
-    
-    skill_gaps = db.query(SkillGap).filter(
-        SkillGap.career_recommendation_id == career_id
-    ).all()
-    
-    return [SkillGapResponse.from_orm(sg) for sg in skill_gaps]
+    career = await CareerService.get_recommendation(db, current_user.id, career_id, CareerRecommendation.skill_gaps)
+    return [SkillGapResponse.from_orm(sg) for sg in career.skill_gaps]
 
 @router.get("/{career_id}/roadmap", response_model=List[LearningRoadmapResponse])
-def get_learning_roadmap(
+async def get_learning_roadmap(
     career_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get learning roadmap for a specific career"""
-    # Verify career belongs to user
-    career = db.query(CareerRecommendation).filter(
-        CareerRecommendation.id == career_id,
-        CareerRecommendation.user_id == current_user.id
-    ).first()
-    
-    if not career:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Career recommendation not found"
-        )
-    
-    roadmap = db.query(LearningRoadmap).filter(
-        LearningRoadmap.career_recommendation_id == career_id
-    ).order_by(LearningRoadmap.order).all()
-    
-    return [LearningRoadmapResponse.from_orm(lr) for lr in roadmap]
+    career = await CareerService.get_recommendation(db, current_user.id, career_id, CareerRecommendation.learning_roadmaps)
+    return [LearningRoadmapResponse.from_orm(lr) for lr in career.learning_roadmaps]
@@ -1,41 +1,41 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.core.dependencies import get_current_active_user
-from app.models.user import User
+from app.core.user_cache import UserSnapshot
 from app.schemas.onboarding import OnboardingDataCreate, OnboardingDataUpdate, OnboardingDataResponse
 from app.services.onboarding_service import OnboardingService
 
 router = APIRouter(prefix="/onboarding", tags=["Onboarding"])
 
 @router.post("", response_model=OnboardingDataResponse, status_code=status.HTTP_201_CREATED)
-def create_onboarding_data(
+async def create_onboarding_data(
     data: OnboardingDataCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create or update onboarding data"""
-    onboarding = OnboardingService.create_or_update_onboarding(db, current_user.id, data)
+    onboarding = await OnboardingService.create_or_update_onboarding(db, current_user.id, data)
     return OnboardingDataResponse.from_orm(onboarding)
 
 @router.put("", response_model=OnboardingDataResponse)
-def update_onboarding_data(
+async def update_onboarding_data(
     data: OnboardingDataUpdate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update onboarding data"""
-    onboarding = OnboardingService.create_or_update_onboarding(db, current_user.id, data)
+    onboarding = await OnboardingService.create_or_update_onboarding(db, current_user.id, data)
     return OnboardingDataResponse.from_orm(onboarding)
 
 @router.get("", response_model=OnboardingDataResponse)
-def get_onboarding_data(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def get_onboarding_data(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's onboarding data"""
     try:
-        onboarding = OnboardingService.get_onboarding_data(db, current_user.id)
+        onboarding = await OnboardingService.get_onboarding_data(db, current_user.id)
         return OnboardingDataResponse.from_orm(onboarding)
     except HTTPException:
         # Return empty data if not found
@@ -51,13 +51,13 @@ def get_onboarding_data(
         )
 
 @router.get("/completeness")
-def get_profile_completeness(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def get_profile_completeness(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get profile completeness percentage"""
     try:
-        onboarding = OnboardingService.get_onboarding_data(db, current_user.id)
+        onboarding = await OnboardingService.get_onboarding_data(db, current_user.id)
         return {
             "completeness": onboarding.profile_completeness,
             "is_completed": onboarding.is_completed,
@@ -1,56 +1,76 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db, get_async_read_db
 from app.core.dependencies import get_current_active_user
-from app.models.user import User
+from app.core.user_cache import UserSnapshot
 from app.schemas.quiz import (
     QuizQuestionResponse,
     QuizAnswerCreate,
+    QuizAnswerBatchCreate,
     QuizAnswerResponse,
     QuizSubmissionResponse,
     QuizProgressResponse
 )
 from app.services.quiz_service import QuizService
+from app.services.quiz_catalog import quiz_catalog
 
 router = APIRouter(prefix="/quiz", tags=["Quiz"])
 
 @router.get("/questions", response_model=List[QuizQuestionResponse])
-def get_quiz_questions(
+async def get_quiz_questions(
+    request: Request,
     section: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get quiz questions filtered by user's field of study"""
-    questions = QuizService.get_questions_for_user(db, current_user.id, section)
-    return [QuizQuestionResponse.from_orm(q) for q in questions]
+    field_of_study = await QuizService.get_user_field_of_study(db, current_user.id)
+    catalog = await quiz_catalog.get(
+        field_of_study, section, lambda: QuizService.get_questions_for_field(db, field_of_study, section)
+    )
+    
+    headers = {"ETag": catalog.etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == catalog.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=catalog.body, media_type="application/json", headers=headers)
 
 @router.post("/answers", response_model=QuizAnswerResponse)
-def save_quiz_answer(
+async def save_quiz_answer(
     answer: QuizAnswerCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Save or update a quiz answer"""
-    db_answer = QuizService.save_answer(db, current_user.id, answer)
+    db_answer = await QuizService.save_answer(db, current_user.id, answer)
     return QuizAnswerResponse.from_orm(db_answer)
 
+@router.post("/answers/batch", response_model=List[QuizAnswerResponse])
+async def save_quiz_answers_batch(
+    batch: QuizAnswerBatchCreate,
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Save or update many quiz answers at once"""
+    answers = await QuizService.save_answers(db, current_user.id, batch.answers)
+    return [QuizAnswerResponse.from_orm(a) for a in answers]
+
 @router.get("/answers", response_model=List[QuizAnswerResponse])
-def get_user_answers(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def get_user_answers(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all answers for current user"""
-    answers = QuizService.get_user_answers(db, current_user.id)
+    answers = await QuizService.get_user_answers(db, current_user.id)
     return [QuizAnswerResponse.from_orm(a) for a in answers]
 
 @router.get("/progress", response_model=QuizProgressResponse)
-def get_quiz_progress(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def get_quiz_progress(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get quiz progress for current user"""
-    submission = QuizService.get_or_create_submission(db, current_user.id)
+    submission = await QuizService.get_or_create_submission(db, current_user.id)
     
     progress_percentage = 0
     if submission.total_questions > 0:
@@ -65,19 +85,19 @@ def get_quiz_progress(
     )
 
 @router.post("/submit", response_model=QuizSubmissionResponse)
-def submit_quiz(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def submit_quiz(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Submit quiz and mark as completed"""
-    submission = QuizService.submit_quiz(db, current_user.id)
+    submission = await QuizService.submit_quiz(db, current_user.id)
     return QuizSubmissionResponse.from_orm(submission)
 
 @router.get("/submission", response_model=QuizSubmissionResponse)
-def get_submission_status(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+async def get_submission_status(
+    current_user: UserSnapshot = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current quiz submission status"""
-    submission = QuizService.get_or_create_submission(db, current_user.id)
+    submission = await QuizService.get_or_create_submission(db, current_user.id)
     return QuizSubmissionResponse.from_orm(submission)
@@ -1,11 +1,82 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from fastapi import Request
+from app.core.pool_metrics import PoolMetrics, pool_metrics, timed_pool_class
+from app.core.read_routing import read_your_writes
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+def _is_postgres(url: str) -> bool:
+    return url.startswith("postgresql")
+
+def _pool_kwargs(url: str, poolclass=None) -> dict:
+    if not _is_postgres(url):
+        return {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    return {
+        "poolclass": poolclass,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+def _async_url(url: str) -> str:
+    for prefix in ("postgresql+psycopg2://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+def _async_database_url() -> str:
+    return settings.ASYNC_DATABASE_URL or _async_url(settings.DATABASE_URL)
+
+# Statement timeout is applied per connection; each driver takes it differently
+def _sync_connect_args(url: str) -> dict:
+    if settings.DB_STATEMENT_TIMEOUT_MS and _is_postgres(url):
+        return {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return {}
+
+def _async_connect_args(url: str) -> dict:
+    if settings.DB_STATEMENT_TIMEOUT_MS and _is_postgres(url):
+        return {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+    return {}
+
+def _build_engine(url: str, name: str):
+    metrics = pool_metrics[name] = PoolMetrics(name)
+    built = create_engine(
+        url, connect_args=_sync_connect_args(url), **_pool_kwargs(url, timed_pool_class(QueuePool, metrics))
+    )
+    metrics.attach(built)
+    return built
+
+def _build_async_engine(url: str, name: str):
+    metrics = pool_metrics[name] = PoolMetrics(name)
+    built = create_async_engine(
+        url, connect_args=_async_connect_args(url), **_pool_kwargs(url, timed_pool_class(AsyncAdaptedQueuePool, metrics))
+    )
+    metrics.attach(built.sync_engine)
+    return built
+
+engine = _build_engine(settings.DATABASE_URL, "primary")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = _build_async_engine(_async_database_url(), "primary_async")
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Read-only traffic goes to the replica when one is configured
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = _build_engine(settings.DATABASE_REPLICA_URL, "replica")
+    async_replica_engine = _build_async_engine(_async_url(settings.DATABASE_REPLICA_URL), "replica_async")
+else:
+    replica_engine = engine
+    async_replica_engine = async_engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+AsyncReadSessionLocal = async_sessionmaker(async_replica_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -14,3 +85,24 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def _read_session_factory(request: Request, primary, replica):
+    """Pick the replica unless the caller wrote recently and could miss it there"""
+    if replica is primary or read_your_writes.recently_wrote(request):
+        return primary
+    return replica
+
+def get_read_db(request: Request):
+    db = _read_session_factory(request, SessionLocal, ReadSessionLocal)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    async with _read_session_factory(request, AsyncSessionLocal, AsyncReadSessionLocal)() as db:
+        yield db
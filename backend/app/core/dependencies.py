@@ -4,6 +4,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import verify_token
+from app.core.user_cache import UserSnapshot, user_cache
 from app.models.user import User
 
 security = HTTPBearer()
@@ -11,7 +12,7 @@ security = HTTPBearer()
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> UserSnapshot:
     token = credentials.credentials
     payload = verify_token(token, "access")
     
@@ -28,6 +29,12 @@ def get_current_user(
             detail="Invalid authentication credentials"
         )
     
+    # Serve recently seen users from the snapshot cache; the session is
+    # never used (and never connects) on a hit
+    snapshot = user_cache.get(int(user_id))
+    if snapshot is not None:
+        return snapshot
+    
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(
@@ -35,14 +42,16 @@ def get_current_user(
             detail="User not found"
         )
     
-    return user
+    snapshot = UserSnapshot.from_user(user)
+    user_cache.set(snapshot)
+    return snapshot
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: UserSnapshot = Depends(get_current_user)) -> UserSnapshot:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-def get_current_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
+def get_current_admin_user(current_user: UserSnapshot = Depends(get_current_active_user)) -> UserSnapshot:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
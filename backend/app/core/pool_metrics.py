@@ -0,0 +1,146 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+class PoolMetrics:
+    """Counters for one connection pool, fed by SQLAlchemy pool events.
+
+    Separates pool starvation (long checkout waits, overflow use) from slow
+    queries (normal waits, connections held a long time).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._pool = None
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self.overflow_checkouts = 0
+        self.wait_count = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+        self.lifetime_count = 0
+        self.lifetime_total_seconds = 0.0
+        self.lifetime_max_seconds = 0.0
+        # connected_at of connections detached from the pool, by id(dbapi_connection)
+        self._detached_connected_at: Dict[int, float] = {}
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_seconds += seconds
+            self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+
+    def _record_close(self, connected_at: Optional[float]):
+        """Count a close; only closes with a known connect time feed the lifetime stats"""
+        with self._lock:
+            self.closes += 1
+            if connected_at is None:
+                return
+            lifetime = time.monotonic() - connected_at
+            self.lifetime_count += 1
+            self.lifetime_total_seconds += lifetime
+            self.lifetime_max_seconds = max(self.lifetime_max_seconds, lifetime)
+
+    def attach(self, engine: Engine):
+        """Register pool event listeners on an engine"""
+        self._pool = engine.pool
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            connection_record.info["connected_at"] = time.monotonic()
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            overflow = self._pool.overflow() > 0 if hasattr(self._pool, "overflow") else False
+            with self._lock:
+                self.checkouts += 1
+                if overflow:
+                    self.overflow_checkouts += 1
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.checkins += 1
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+        @event.listens_for(engine, "close")
+        def on_close(dbapi_connection, connection_record):
+            self._record_close(connection_record.info.pop("connected_at", None))
+
+        # A detached connection loses its pool record, so carry its connect
+        # time over until it is closed
+        @event.listens_for(engine, "detach")
+        def on_detach(dbapi_connection, connection_record):
+            connected_at = connection_record.info.pop("connected_at", None)
+            if connected_at is not None:
+                with self._lock:
+                    self._detached_connected_at[id(dbapi_connection)] = connected_at
+
+        @event.listens_for(engine, "close_detached")
+        def on_close_detached(dbapi_connection):
+            with self._lock:
+                connected_at = self._detached_connected_at.pop(id(dbapi_connection), None)
+            self._record_close(connected_at)
+
+        # Pools are replaced on dispose(); keep reading gauges from the live one
+        @event.listens_for(engine, "engine_disposed")
+        def on_disposed(disposed_engine):
+            self._pool = disposed_engine.pool
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self._pool
+        with self._lock:
+            return {
+                "pool_size": pool.size() if hasattr(pool, "size") else None,
+                "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+                "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "overflow_checkouts": self.overflow_checkouts,
+                "connects": self.connects,
+                "closes": self.closes,
+                "invalidations": self.invalidations,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(self.wait_total_seconds / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3),
+                "connection_lifetime_avg_seconds": round(self.lifetime_total_seconds / self.lifetime_count, 1) if self.lifetime_count else None,
+                "connection_lifetime_max_seconds": round(self.lifetime_max_seconds, 1),
+            }
+
+
+def timed_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass ``base`` so the time spent waiting for a connection is recorded.
+
+    SQLAlchemy has no event for the start of a checkout, so the wait is
+    measured around the pool's internal ``_do_get``. The subclass survives
+    pool recreation because ``Pool.recreate`` instantiates ``self.__class__``.
+    """
+
+    def _do_get(self):
+        started = time.monotonic()
+        try:
+            return base._do_get(self)
+        finally:
+            metrics.record_wait(time.monotonic() - started)
+
+    return type(f"Timed{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+# Filled in by app.core.database as engines are created
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+def pool_metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
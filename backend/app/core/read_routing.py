@@ -0,0 +1,47 @@
+import threading
+import time
+from typing import Dict, Optional
+from starlette.requests import Request
+from app.core.config import settings
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+class ReadYourWritesTracker:
+    """Remember which callers wrote recently so their reads stay on the primary.
+
+    Callers are identified by their Authorization header, so no token
+    decoding is needed. Tracking is per process: a write served by another
+    API worker is not seen here, which is acceptable as long as the window
+    comfortably exceeds the usual replica lag.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._writes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _caller_key(request: Request) -> Optional[str]:
+        return request.headers.get("authorization")
+
+    def mark_write(self, request: Request):
+        key = self._caller_key(request)
+        if key is None or self.window_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._writes[key] = now + self.window_seconds
+            # Drop expired entries so the map stays bounded by active writers
+            if len(self._writes) > 1024:
+                self._writes = {k: until for k, until in self._writes.items() if until > now}
+
+    def recently_wrote(self, request: Request) -> bool:
+        key = self._caller_key(request)
+        if key is None:
+            return False
+        with self._lock:
+            until = self._writes.get(key)
+        return until is not None and until > time.monotonic()
+
+
+read_your_writes = ReadYourWritesTracker(settings.DB_READ_YOUR_WRITES_SECONDS)
@@ -1,14 +1,32 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# bcrypt is pure CPU work; it runs in a bounded process pool so a burst of
+# logins cannot starve request handling. Created lazily so importing this
+# module (and forking workers) stays cheap. The pool is first used inside a
+# multithreaded server, so its workers are spawned rather than forked: a
+# fork could copy a lock held by another thread and deadlock the worker.
+_password_executor: Optional[ProcessPoolExecutor] = None
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a new hash if the stored one uses an outdated cost"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     # Truncate password to 72 bytes to comply with bcrypt limitation
     password_bytes = password.encode('utf-8')
@@ -16,6 +34,35 @@ def get_password_hash(password: str) -> str:
         password = password_bytes[:72].decode('utf-8', errors='ignore')
     return pwd_context.hash(password)
 
+def _get_password_executor() -> Optional[ProcessPoolExecutor]:
+    global _password_executor
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    if _password_executor is None:
+        _password_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _password_executor
+
+async def _run_password_task(func, *args):
+    executor = _get_password_executor()
+    if executor is None:
+        return await run_in_threadpool(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return await _run_password_task(verify_and_update_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_task(get_password_hash, password)
+
+def shutdown_password_executor():
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -33,11 +80,74 @@ def create_refresh_token(data: dict) -> str:
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
+def _decode_with_jose(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        if payload.get("type") != token_type:
-            return None
-        return payload
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+
+def _decode_with_pyjwt(token: str) -> Optional[dict]:
+    import jwt as pyjwt
+    try:
+        return pyjwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except pyjwt.InvalidTokenError:
+        return None
+
+JWT_BACKENDS: Dict[str, Callable[[str], Optional[dict]]] = {
+    "jose": _decode_with_jose,
+    "pyjwt": _decode_with_pyjwt,
+}
+if settings.JWT_BACKEND not in JWT_BACKENDS:
+    raise ValueError(f"Unknown JWT backend: {settings.JWT_BACKEND}")
+
+class VerifiedTokenCache:
+    """LRU of already verified tokens, each kept only until its ``exp`` claim"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+        return dict(payload)
+
+    def set(self, token: str, payload: dict):
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        with self._lock:
+            self._entries[token] = (expires_at, dict(payload))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+verified_token_cache = VerifiedTokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+
+def decode_token(token: str) -> Optional[dict]:
+    """Verify a token's signature and registered claims without caching"""
+    return JWT_BACKENDS[settings.JWT_BACKEND](token)
+
+def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
+    payload = verified_token_cache.get(token)
+    if payload is None:
+        payload = decode_token(token)
+        if payload is None:
+            return None
+        verified_token_cache.set(token, payload)
+    if payload.get("type") != token_type:
+        return None
+    return payload
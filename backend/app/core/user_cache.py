@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy import event
+from app.core.config import settings
+from app.models.user import User
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable copy of the user fields authenticated endpoints read.
+
+    Stands in for the ``User`` row returned by ``get_current_user``; it is
+    detached from any session, so it is safe to share between requests.
+    """
+    id: int
+    email: str
+    full_name: Optional[str]
+    role: str
+    is_active: bool
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at
+        )
+
+
+class UserCache:
+    """Per-process LRU of user snapshots with a short TTL"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, UserSnapshot]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[UserSnapshot]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return snapshot
+
+    def set(self, snapshot: UserSnapshot):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[snapshot.id] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(snapshot.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
+
+# Any ORM change to a user (role, status, profile) drops its snapshot in this
+# process; bulk UPDATEs and other processes are covered by the TTL.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    user_cache.invalidate(target.id)
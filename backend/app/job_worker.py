@@ -0,0 +1,26 @@
+"""
+Standalone recommendation job worker
+Run with: python -m app.job_worker [worker_count]
+
+Set JOB_WORKER_COUNT=0 on the API replicas to leave job processing to
+dedicated worker processes.
+"""
+import asyncio
+import sys
+from app.services.job_service import JobWorkerPool
+
+async def main(worker_count: int):
+    pool = JobWorkerPool(worker_count)
+    pool.start()
+    print(f"Recommendation job worker started with {worker_count} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+
+if __name__ == "__main__":
+    worker_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    try:
+        asyncio.run(main(worker_count))
+    except KeyboardInterrupt:
+        print("Recommendation job worker stopped")
@@ -0,0 +1,33 @@
+"""
+Access token verification benchmark
+Run with: python -m app.jwt_benchmark [iterations]
+
+Compares uncached verification with each JWT backend against the cached
+verify_token path for a single repeatedly presented access token.
+"""
+import sys
+import time
+from app.core import security
+
+def measure(label: str, verify, iterations: int):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        assert verify() is not None
+    elapsed = time.perf_counter() - started
+    print(f"{label:>14}: {iterations / elapsed:12.0f} verifications/sec ({elapsed / iterations * 1e6:7.2f} us each)")
+
+def main(iterations: int):
+    token = security.create_access_token({"sub": "1"})
+    for name, decode in security.JWT_BACKENDS.items():
+        try:
+            decode(token)
+        except ImportError:
+            print(f"{name:>14}: not installed")
+            continue
+        measure(name, lambda: decode(token), iterations)
+
+    security.verified_token_cache.clear()
+    measure("cached", lambda: security.verify_token(token, "access"), iterations)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -1,11 +1,16 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1.router import api_router
 from app.core.database import engine, SessionLocal
+from app.core.pool_metrics import pool_metrics_snapshot
+from app.core.read_routing import SAFE_METHODS, read_your_writes
 from app.models import base
 from app.models.user import User
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, shutdown_password_executor
+from app.services.job_service import job_worker_pool
+from app.services.stats_service import admin_stats_refresher
+from app.services.circuit_breaker import gemini_circuit_breaker
 
 # Create database tables
 base.Base.metadata.create_all(bind=engine)
@@ -51,9 +56,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def track_writes(request: Request, call_next):
+    response = await call_next(request)
+    # Mark after the response so the window starts once the write is committed
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        read_your_writes.mark_write(request)
+    return response
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+async def start_job_workers():
+    job_worker_pool.start()
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await job_worker_pool.stop()
+
+@app.on_event("startup")
+async def start_stats_refresher():
+    admin_stats_refresher.start()
+
+@app.on_event("shutdown")
+async def stop_stats_refresher():
+    await admin_stats_refresher.stop()
+
+@app.on_event("shutdown")
+def stop_password_workers():
+    shutdown_password_executor()
+
 @app.get("/")
 def root():
     return {
@@ -64,7 +97,11 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "circuits": {"gemini": gemini_circuit_breaker.snapshot()},
+        "database_pools": pool_metrics_snapshot()
+    }
 
 if __name__ == "__main__":
     import uvicorn
@@ -4,6 +4,9 @@ from app.models.onboarding import OnboardingData
 from app.models.quiz import QuizQuestion, QuizAnswer, QuizSubmission
 from app.models.career import CareerRecommendation, SkillGap, LearningRoadmap
 from app.models.learning import LearningMaterial
+from app.models.job import RecommendationJob
+from app.models.cache import LLMResponseCache
+from app.models.stats import AdminStatsSummary
 
 __all__ = [
     "Base",
@@ -16,4 +19,7 @@ __all__ = [
     "SkillGap",
     "LearningRoadmap",
     "LearningMaterial",
+    "RecommendationJob",
+    "LLMResponseCache",
+    "AdminStatsSummary",
 ]
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, Text
+from datetime import datetime
+from app.models.base import Base
+
+class LLMResponseCache(Base):
+    __tablename__ = "llm_response_cache"
+    
+    cache_key = Column(String(64), primary_key=True)  # sha256 of profile + prompt version + model
+    model_name = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)  # Serialized parsed response
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.base import Base
@@ -27,10 +27,19 @@ class CareerRecommendation(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index("ix_career_recommendations_user_id_match_score", "user_id", "match_score"),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="career_recommendations")
     skill_gaps = relationship("SkillGap", back_populates="career_recommendation", cascade="all, delete-orphan")
-    learning_roadmaps = relationship("LearningRoadmap", back_populates="career_recommendation", cascade="all, delete-orphan")
+    learning_roadmaps = relationship(
+        "LearningRoadmap",
+        back_populates="career_recommendation",
+        cascade="all, delete-orphan",
+        order_by="LearningRoadmap.order"
+    )
 
 class SkillGap(Base):
     __tablename__ = "skill_gaps"
@@ -46,6 +55,10 @@ class SkillGap(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        Index("ix_skill_gaps_career_recommendation_id", "career_recommendation_id"),
+    )
+    
     # Relationship
     career_recommendation = relationship("CareerRecommendation", back_populates="skill_gaps")
 
@@ -64,5 +77,9 @@ class LearningRoadmap(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index("ix_learning_roadmaps_career_recommendation_id_order", "career_recommendation_id", "order"),
+    )
+    
     # Relationship
     career_recommendation = relationship("CareerRecommendation", back_populates="learning_roadmaps")
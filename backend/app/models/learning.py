@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, Index, text
 from datetime import datetime
 from app.models.base import Base
 
@@ -21,3 +21,13 @@ class LearningMaterial(Base):
     created_by = Column(Integer, nullable=True)  # Admin user ID
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Public listing of active materials, newest first
+        Index(
+            "ix_learning_materials_active_created_at",
+            "created_at",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1")
+        ),
+    )
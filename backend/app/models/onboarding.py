@@ -16,7 +16,7 @@ class OnboardingData(Base):
     
     # Education
     education_level = Column(String, nullable=True)
-    field_of_study = Column(String, nullable=True)
+    field_of_study = Column(String, nullable=True, index=True)
     institution = Column(String, nullable=True)
     graduation_year = Column(Integer, nullable=True)
     
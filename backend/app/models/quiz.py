@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Text, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.base import Base
@@ -17,6 +17,16 @@ class QuizQuestion(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Active catalog lookups by field of study and section, in display order
+        Index(
+            "ix_quiz_questions_active_field_section_order",
+            "field_of_study", "section", "order",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1")
+        ),
+    )
+    
     # Relationship
     answers = relationship("QuizAnswer", back_populates="question")
 
@@ -30,6 +40,10 @@ class QuizAnswer(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index("ix_quiz_answers_user_id_question_id", "user_id", "question_id", unique=True),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="quiz_answers")
     question = relationship("QuizQuestion", back_populates="answers")
@@ -41,11 +55,16 @@ class QuizSubmission(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_completed = Column(Boolean, default=False)
     completed_sections = Column(JSON, nullable=True)  # Array of completed sections
+    section_answer_counts = Column(JSON, nullable=True)  # Answered questions per section, kept incrementally
     total_questions = Column(Integer, default=0)
     answered_questions = Column(Integer, default=0)
     submitted_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index("ix_quiz_submissions_user_id_created_at", "user_id", "created_at"),
+    )
+    
     # Relationship
     user = relationship("User", back_populates="quiz_submissions")
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, DateTime, JSON
+from datetime import datetime
+from app.models.base import Base
+
+class AdminStatsSummary(Base):
+    __tablename__ = "admin_stats_summary"
+    
+    id = Column(Integer, primary_key=True)  # Single row, id = 1
+    total_users = Column(Integer, nullable=False, default=0)
+    active_users = Column(Integer, nullable=False, default=0)
+    completed_onboarding = Column(Integer, nullable=False, default=0)
+    completed_quiz = Column(Integer, nullable=False, default=0)
+    total_learning_materials = Column(Integer, nullable=False, default=0)
+    total_recommendations = Column(Integer, nullable=False, default=0)
+    total_quiz_questions = Column(Integer, nullable=False, default=0)
+    users_by_field = Column(JSON, nullable=False, default=dict)  # field_of_study -> user count
+    
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
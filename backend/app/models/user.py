@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.base import Base
@@ -15,6 +15,13 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Keyset pagination of the admin user listing
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # The pg_trgm search indexes need the extension and live only in
+        # migration 010
+    )
+    
     # Relationships
     onboarding_data = relationship("OnboardingData", back_populates="user", uselist=False)
     quiz_submissions = relationship("QuizSubmission", back_populates="user")
@@ -0,0 +1,46 @@
+"""
+Password verification throughput benchmark
+Run with: python -m app.password_benchmark [max_workers] [logins]
+
+Measures logins/sec for the password process pool at 1..max_workers
+processes, next to inline verification on the event loop thread, using the
+configured BCRYPT_ROUNDS.
+"""
+import asyncio
+import os
+import sys
+import time
+from app.core import security
+from app.core.config import settings
+
+PASSWORD = "benchmark-password"
+
+async def run_pool(workers: int, logins: int, hashed: str) -> float:
+    settings.PASSWORD_HASH_WORKERS = workers
+    security.shutdown_password_executor()
+    # Warm the pool so process start-up is not counted
+    await asyncio.gather(*[security.verify_and_update_password_async(PASSWORD, hashed) for _ in range(max(workers, 1))])
+
+    started = time.perf_counter()
+    await asyncio.gather(*[security.verify_and_update_password_async(PASSWORD, hashed) for _ in range(logins)])
+    elapsed = time.perf_counter() - started
+    security.shutdown_password_executor()
+    return logins / elapsed
+
+def run_inline(logins: int, hashed: str) -> float:
+    started = time.perf_counter()
+    for _ in range(logins):
+        security.verify_password(PASSWORD, hashed)
+    return logins / (time.perf_counter() - started)
+
+async def main(max_workers: int, logins: int):
+    hashed = security.get_password_hash(PASSWORD)
+    print(f"bcrypt rounds={settings.BCRYPT_ROUNDS}, {logins} logins, {os.cpu_count()} CPUs")
+    print(f"{'inline':>10}: {run_inline(logins, hashed):8.1f} logins/sec")
+    for workers in range(1, max_workers + 1):
+        print(f"{workers:>3} procs : {await run_pool(workers, logins, hashed):8.1f} logins/sec")
+
+if __name__ == "__main__":
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 2)
+    logins = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    asyncio.run(main(max_workers, logins))
@@ -0,0 +1,31 @@
+"""
+Recount quiz progress from stored answers
+Run with: python -m app.reconcile_quiz_progress [user_id ...]
+
+Quiz progress counters are maintained incrementally as answers are saved.
+This repairs any drift (deleted or deactivated questions, manual data fixes)
+for the given users, or for every user with a submission.
+"""
+import asyncio
+import sys
+from typing import List
+from sqlalchemy import select
+from app.core.database import AsyncSessionLocal
+from app.models.quiz import QuizSubmission
+from app.services.quiz_service import QuizService
+
+async def reconcile(user_ids: List[int]):
+    async with AsyncSessionLocal() as db:
+        if not user_ids:
+            user_ids = list(await db.scalars(select(QuizSubmission.user_id).distinct()))
+
+        repaired = 0
+        for user_id in user_ids:
+            if await QuizService.reconcile_progress(db, user_id):
+                repaired += 1
+                print(f"🔧 Repaired quiz progress for user {user_id}")
+
+    print(f"✅ Checked {len(user_ids)} users, repaired {repaired}")
+
+if __name__ == "__main__":
+    asyncio.run(reconcile([int(user_id) for user_id in sys.argv[1:]]))
@@ -15,6 +15,7 @@ from app.schemas.quiz import (
     QuizQuestionUpdate,
     QuizQuestionResponse,
     QuizAnswerCreate,
+    QuizAnswerBatchCreate,
     QuizAnswerResponse,
     QuizSubmissionResponse,
     QuizProgressResponse
@@ -25,7 +26,8 @@ from app.schemas.career import (
     CareerRecommendationDetailResponse,
     SkillGapResponse,
     LearningRoadmapResponse,
-    GenerateRecommendationsRequest
+    GenerateRecommendationsRequest,
+    RecommendationJobResponse
 )
 
 __all__ = [
@@ -41,6 +43,7 @@ __all__ = [
     "QuizQuestionUpdate",
     "QuizQuestionResponse",
     "QuizAnswerCreate",
+    "QuizAnswerBatchCreate",
     "QuizAnswerResponse",
     "QuizSubmissionResponse",
     "QuizProgressResponse",
@@ -50,4 +53,5 @@ __all__ = [
     "SkillGapResponse",
     "LearningRoadmapResponse",
     "GenerateRecommendationsRequest",
+    "RecommendationJobResponse",
 ]
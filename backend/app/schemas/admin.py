@@ -29,6 +29,7 @@ class UserListResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
 
 # Learning Material schemas
 class LearningMaterialCreate(BaseModel):
@@ -92,3 +93,4 @@ class AdminDashboardStats(BaseModel):
     completed_quiz: int
     total_learning_materials: int
     users_by_field: dict
+    refreshed_at: Optional[datetime] = None
@@ -63,3 +63,15 @@ class CareerRecommendationDetailResponse(CareerRecommendationResponse):
 
 class GenerateRecommendationsRequest(BaseModel):
     force_regenerate: bool = False
+
+class RecommendationJobResponse(BaseModel):
+    id: int
+    status: str
+    force_regenerate: bool
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Any
 from datetime import datetime
 
@@ -34,6 +34,9 @@ class QuizAnswerCreate(BaseModel):
     question_id: int
     answer: Any  # Can be string, number, or array
 
+class QuizAnswerBatchCreate(BaseModel):
+    answers: List[QuizAnswerCreate] = Field(..., min_length=1, max_length=500)
+
 class QuizAnswerResponse(BaseModel):
     id: int
     user_id: int
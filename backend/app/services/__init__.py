@@ -2,10 +2,14 @@ from app.services.auth_service import AuthService
 from app.services.onboarding_service import OnboardingService
 from app.services.quiz_service import QuizService
 from app.services.gemini_service import GeminiService
+from app.services.job_service import JobService
+from app.services.career_service import CareerService
 
 __all__ = [
     "AuthService",
     "OnboardingService",
     "QuizService",
     "GeminiService",
+    "JobService",
+    "CareerService",
 ]
@@ -0,0 +1,214 @@
+import base64
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, func, select, tuple_
+from sqlalchemy.orm import Query, Session
+from app.models.user import User
+from app.models.onboarding import OnboardingData
+from app.models.quiz import QuizSubmission
+from app.schemas.admin import UserAdminResponse
+from app.services.user_search import UserSearch
+
+def encode_cursor(created_at: datetime, user_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), user_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+class AdminUserService:
+    @staticmethod
+    def detailed_users_query(db: Session, field_of_study: Optional[str] = None, search: Optional[str] = None) -> Query:
+        """Users with their onboarding row and quiz completion flag, in one query"""
+        quiz_completed = exists().where(
+            QuizSubmission.user_id == User.id,
+            QuizSubmission.is_completed == True
+        ).label("quiz_completed")
+
+        query = db.query(User, OnboardingData, quiz_completed).outerjoin(
+            OnboardingData, OnboardingData.user_id == User.id
+        )
+
+        if field_of_study:
+            query = query.filter(OnboardingData.field_of_study == field_of_study)
+
+        if search:
+            query = query.filter(UserSearch(search, db.get_bind().dialect.name).filter())
+
+        return query
+
+    @staticmethod
+    def list_users(
+        db: Session,
+        per_page: int,
+        field_of_study: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page: int = 1
+    ) -> Tuple[List[UserAdminResponse], int, Optional[str]]:
+        """One page of users, newest first, plus the total and the next page's cursor.
+
+        With a cursor the page is found by keyset on (created_at, id), which
+        costs the same at any depth; ``page`` is the offset fallback. Searches
+        are ranked by relevance instead and always paginate by offset.
+        """
+        query = AdminUserService.detailed_users_query(db, field_of_study, search)
+        total = query.with_entities(User.id).count()
+
+        if search:
+            ranking = UserSearch(search, db.get_bind().dialect.name).order_by()
+            rows = query.order_by(*ranking, User.created_at.desc(), User.id.desc()).offset(
+                (page - 1) * per_page
+            ).limit(per_page).all()
+            return [AdminUserService.to_admin_response(*row) for row in rows], total, None
+
+        query = query.order_by(User.created_at.desc(), User.id.desc())
+        if cursor:
+            created_at, user_id = decode_cursor(cursor)
+            query = query.filter(tuple_(User.created_at, User.id) < (created_at, user_id))
+        else:
+            query = query.offset((page - 1) * per_page)
+
+        rows = query.limit(per_page).all()
+
+        next_cursor = None
+        if len(rows) == per_page:
+            last_user = rows[-1][0]
+            next_cursor = encode_cursor(last_user.created_at, last_user.id)
+
+        return [AdminUserService.to_admin_response(*row) for row in rows], total, next_cursor
+
+    @staticmethod
+    def get_user(db: Session, user_id: int) -> UserAdminResponse:
+        row = AdminUserService.detailed_users_query(db).filter(User.id == user_id).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        return AdminUserService.to_admin_response(*row)
+
+    @staticmethod
+    def to_admin_response(user: User, onboarding: Optional[OnboardingData], quiz_completed: bool) -> UserAdminResponse:
+        return UserAdminResponse(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_admin=(user.role == "admin"),
+            created_at=user.created_at,
+            field_of_study=onboarding.field_of_study if onboarding else None,
+            education_level=onboarding.education_level if onboarding else None,
+            institution=onboarding.institution if onboarding else None,
+            interests=onboarding.interests if onboarding else None,
+            technical_skills=onboarding.technical_skills if onboarding else None,
+            soft_skills=onboarding.soft_skills if onboarding else None,
+            career_goals=onboarding.career_goals if onboarding else None,
+            onboarding_completed=onboarding.is_completed if onboarding else False,
+            quiz_completed=bool(quiz_completed)
+        )
+
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    User.id.label("user_id"),
+    User.email,
+    User.full_name,
+    User.role,
+    User.is_active,
+    User.created_at,
+    OnboardingData.age,
+    OnboardingData.gender,
+    OnboardingData.location,
+    OnboardingData.education_level,
+    OnboardingData.field_of_study,
+    OnboardingData.institution,
+    OnboardingData.graduation_year,
+    OnboardingData.years_of_experience,
+    OnboardingData.current_role,
+    OnboardingData.industry,
+    OnboardingData.technical_skills,
+    OnboardingData.soft_skills,
+    OnboardingData.interests,
+    OnboardingData.career_goals,
+    OnboardingData.is_completed.label("onboarding_completed"),
+    OnboardingData.profile_completeness,
+    QuizSubmission.is_completed.label("quiz_completed"),
+    QuizSubmission.answered_questions.label("quiz_answered_questions"),
+    QuizSubmission.total_questions.label("quiz_total_questions"),
+    QuizSubmission.submitted_at.label("quiz_submitted_at"),
+]
+
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+class UserExporter:
+    """Streams users joined with onboarding data and their latest quiz submission.
+
+    Rows are read through a server-side cursor in batches of
+    ``EXPORT_BATCH_SIZE``, so memory stays flat however many users there are.
+    """
+
+    def __init__(self, db: Session, field_of_study: Optional[str] = None, search: Optional[str] = None):
+        self.db = db
+        self.field_of_study = field_of_study
+        self.search = search
+
+    def _query(self):
+        latest_submission_id = select(func.max(QuizSubmission.id)).where(
+            QuizSubmission.user_id == User.id
+        ).correlate(User).scalar_subquery()
+
+        query = select(*EXPORT_COLUMNS).outerjoin(
+            OnboardingData, OnboardingData.user_id == User.id
+        ).outerjoin(
+            QuizSubmission,
+            and_(QuizSubmission.user_id == User.id, QuizSubmission.id == latest_submission_id)
+        )
+        if self.field_of_study:
+            query = query.where(OnboardingData.field_of_study == self.field_of_study)
+        if self.search:
+            query = query.where(UserSearch(self.search, self.db.get_bind().dialect.name).filter())
+        return query.order_by(User.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for row in self.db.execute(self._query()):
+            yield row._asdict()
+
+    def iter_csv(self) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        for count, row in enumerate(self.rows(), start=1):
+            writer.writerow([
+                json.dumps(value) if isinstance(value, (list, dict)) else value
+                for value in row.values()
+            ])
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def iter_ndjson(self) -> Iterator[str]:
+        lines = []
+        for row in self.rows():
+            lines.append(json.dumps(row, default=str))
+            if len(lines) == EXPORT_BATCH_SIZE:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
@@ -1,15 +1,21 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.core.security import get_password_hash, verify_password, create_access_token, create_refresh_token
+from app.core.security import (
+    get_password_hash_async,
+    verify_and_update_password_async,
+    create_access_token,
+    create_refresh_token
+)
 
 class AuthService:
     @staticmethod
-    def create_user(db: Session, user_create: UserCreate) -> User:
+    async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
         # Check if user exists
-        existing_user = db.query(User).filter(User.email == user_create.email).first()
+        existing_user = await db.scalar(select(User).filter(User.email == user_create.email))
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -17,24 +23,29 @@ class AuthService:
             )
         
         # Create new user
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = await get_password_hash_async(user_create.password)
         db_user = User(
             email=user_create.email,
             full_name=user_create.full_name,
             hashed_password=hashed_password
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
     
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-        user = db.query(User).filter(User.email == email).first()
+    async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+        user = await db.scalar(select(User).filter(User.email == email))
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not verified:
             return None
+        # Upgrade hashes created with a different BCRYPT_ROUNDS
+        if new_hash:
+            user.hashed_password = new_hash
+            await db.commit()
         return user
     
     @staticmethod
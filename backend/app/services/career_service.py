@@ -0,0 +1,41 @@
+from typing import List
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.models.career import CareerRecommendation
+
+class CareerService:
+    @staticmethod
+    async def get_recommendation(db: AsyncSession, user_id: int, career_id: int, *children) -> CareerRecommendation:
+        """Load one of the user's recommendations with the given child collections.
+
+        Each collection costs one extra ``selectinload`` query, so a detail
+        read is at most three queries and nothing lazy-loads during serialization.
+        """
+        career = await db.scalar(
+            select(CareerRecommendation).filter(
+                CareerRecommendation.id == career_id,
+                CareerRecommendation.user_id == user_id
+            ).options(*[selectinload(child) for child in children])
+        )
+        
+        if not career:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Career recommendation not found"
+            )
+        
+        return career
+    
+    @staticmethod
+    async def get_recommendations_with_details(db: AsyncSession, user_id: int) -> List[CareerRecommendation]:
+        """All of the user's recommendations with skill gaps and roadmaps, in three queries"""
+        return (await db.scalars(
+            select(CareerRecommendation).filter(
+                CareerRecommendation.user_id == user_id
+            ).order_by(CareerRecommendation.match_score.desc()).options(
+                selectinload(CareerRecommendation.skill_gaps),
+                selectinload(CareerRecommendation.learning_roadmaps)
+            )
+        )).all()
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from app.core.config import settings
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for an unreliable downstream client.
+
+    Calls slower than ``slow_call_seconds`` count against the circuit just
+    like errors. Once the bad-call rate over the last ``window_seconds``
+    reaches ``failure_rate_threshold`` the circuit opens and calls are
+    rejected immediately. After ``open_seconds`` a limited number of probe
+    calls are let through (half-open); a successful probe closes the
+    circuit and a failed one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float,
+        minimum_calls: int,
+        failure_rate_threshold: float,
+        slow_call_seconds: float,
+        open_seconds: float,
+        half_open_max_calls: int
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+        # (timestamp, succeeded, latency) for calls inside the rolling window
+        self._calls: Deque[Tuple[float, bool, float]] = deque()
+        self._counters = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    def _prune(self, now: float):
+        while self._calls and self._calls[0][0] < now - self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._half_open_in_flight = 0
+        self._counters["opened"] += 1
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go ahead, counting it as a probe if half-open"""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+            self._counters["rejected"] += 1
+            return False
+
+    def record(self, succeeded: bool, latency: float):
+        """Record the outcome of a call that was allowed through"""
+        now = time.monotonic()
+        slow = latency >= self.slow_call_seconds
+        with self._lock:
+            self._counters["calls"] += 1
+            if not succeeded:
+                self._counters["failures"] += 1
+            if slow:
+                self._counters["slow_calls"] += 1
+
+            state = self._current_state(now)
+            if state == self.HALF_OPEN:
+                if succeeded and not slow:
+                    self._state = self.CLOSED
+                    self._calls.clear()
+                else:
+                    self._open(now)
+                return
+
+            self._calls.append((now, succeeded, latency))
+            self._prune(now)
+            if state == self.CLOSED and len(self._calls) >= self.minimum_calls:
+                bad_calls = sum(
+                    1 for _, ok, call_latency in self._calls
+                    if not ok or call_latency >= self.slow_call_seconds
+                )
+                if bad_calls / len(self._calls) >= self.failure_rate_threshold:
+                    self._open(now)
+
+    def release(self):
+        """Give back a call that was allowed through but ended without an outcome"""
+        with self._lock:
+            if self._current_state(time.monotonic()) == self.HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state and counters for health checks and metrics"""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._prune(now)
+            window_calls = len(self._calls)
+            window_failures = sum(1 for _, ok, _ in self._calls if not ok)
+            latencies = sorted(latency for _, _, latency in self._calls)
+            return {
+                "state": state,
+                "window_calls": window_calls,
+                "window_failure_rate": round(window_failures / window_calls, 3) if window_calls else 0.0,
+                "window_p95_latency_seconds": round(latencies[int(0.95 * (window_calls - 1))], 3) if latencies else None,
+                **self._counters,
+            }
+
+
+gemini_circuit_breaker = CircuitBreaker(
+    name="gemini",
+    window_seconds=settings.GEMINI_CIRCUIT_WINDOW_SECONDS,
+    minimum_calls=settings.GEMINI_CIRCUIT_MINIMUM_CALLS,
+    failure_rate_threshold=settings.GEMINI_CIRCUIT_FAILURE_RATE,
+    slow_call_seconds=settings.GEMINI_CIRCUIT_SLOW_CALL_SECONDS,
+    open_seconds=settings.GEMINI_CIRCUIT_OPEN_SECONDS,
+    half_open_max_calls=settings.GEMINI_CIRCUIT_HALF_OPEN_MAX_CALLS
+)
@@ -0,0 +1,71 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "fallback_recommendations.json"
+
+Recommendation = Mapping[str, Any]
+
+def _freeze_recommendation(data: Dict[str, Any]) -> Recommendation:
+    """Wrap a catalog entry in read-only containers"""
+    frozen = dict(data)
+    frozen["required_skills"] = tuple(data.get("required_skills") or [])
+    frozen["skill_gaps"] = tuple(
+        MappingProxyType(dict(gap)) for gap in data.get("skill_gaps", [])
+    )
+    frozen["learning_roadmap"] = tuple(
+        MappingProxyType({
+            **phase,
+            "objectives": tuple(phase.get("objectives") or []),
+            "resources": tuple(phase.get("resources") or []),
+        })
+        for phase in data.get("learning_roadmap", [])
+    )
+    return MappingProxyType(frozen)
+
+
+class FallbackCatalog:
+    """Preloaded fallback recommendations grouped into field-of-study buckets"""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.version = raw["version"]
+        self._buckets = tuple(
+            (
+                bucket["name"],
+                re.compile("|".join(re.escape(keyword) for keyword in bucket["keywords"])),
+                tuple(_freeze_recommendation(rec) for rec in bucket["recommendations"]),
+            )
+            for bucket in raw["buckets"]
+        )
+        self.default_bucket = raw["default"]["name"]
+        self._recommendations = MappingProxyType({
+            **{name: recommendations for name, _, recommendations in self._buckets},
+            self.default_bucket: tuple(
+                _freeze_recommendation(rec) for rec in raw["default"]["recommendations"]
+            ),
+        })
+        # Field names repeat a lot across users, so remember each match
+        self.bucket_for_field = lru_cache(maxsize=1024)(self._match_bucket)
+
+    @classmethod
+    def load(cls, path: Path = CATALOG_PATH) -> "FallbackCatalog":
+        with open(path, encoding="utf-8") as catalog_file:
+            return cls(json.load(catalog_file))
+
+    def _match_bucket(self, field_of_study: str) -> str:
+        # Buckets are checked in catalog order; the first one with a keyword hit wins
+        for name, matcher, _ in self._buckets:
+            if matcher.search(field_of_study):
+                return name
+        return self.default_bucket
+
+    def recommendations_for(self, field_of_study: Optional[str]) -> Tuple[Recommendation, ...]:
+        """Return the read-only recommendation templates for a field of study"""
+        field = (field_of_study or "").lower()
+        return self._recommendations[self.bucket_for_field(field)]
+
+
+fallback_catalog = FallbackCatalog.load()
@@ -0,0 +1,211 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.user_cache import UserSnapshot
+from app.models.job import RecommendationJob
+from app.models.user import User
+from app.services.gemini_service import GeminiService
+
+class JobService:
+    @staticmethod
+    def enqueue_recommendation_job(db: Session, user_id: int, force_regenerate: bool = False) -> RecommendationJob:
+        """Queue a recommendation generation job for a user"""
+        # Reuse a pending job for the same request instead of stacking
+        # duplicates; a running job whose worker died is requeued by
+        # claim_next_job once its lease runs out
+        pending = db.query(RecommendationJob).filter(
+            RecommendationJob.user_id == user_id,
+            RecommendationJob.status.in_(["queued", "running"]),
+            RecommendationJob.force_regenerate == force_regenerate
+        ).order_by(RecommendationJob.created_at.desc()).first()
+        if pending:
+            return pending
+
+        job = RecommendationJob(
+            user_id=user_id,
+            status="queued",
+            force_regenerate=force_regenerate
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def get_job(db: Session, user_id: int, job_id: int) -> RecommendationJob:
+        job = db.query(RecommendationJob).filter(
+            RecommendationJob.id == job_id,
+            RecommendationJob.user_id == user_id
+        ).first()
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return job
+
+    @staticmethod
+    def claim_next_job(db: Session) -> Optional[RecommendationJob]:
+        """Claim the oldest queued job, or a running job whose lease has expired.
+
+        Uses ``SELECT ... FOR UPDATE SKIP LOCKED`` so any number of workers,
+        in this process or others, can poll the same table without handing
+        out a job twice. A running job that has not sent a heartbeat for
+        ``JOB_LEASE_SECONDS`` belonged to a worker that died; it is retried
+        until it has been attempted ``JOB_MAX_ATTEMPTS`` times, then failed.
+        """
+        while True:
+            lease_cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_LEASE_SECONDS)
+            job = db.query(RecommendationJob).filter(
+                or_(
+                    RecommendationJob.status == "queued",
+                    and_(
+                        RecommendationJob.status == "running",
+                        or_(
+                            RecommendationJob.heartbeat_at < lease_cutoff,
+                            RecommendationJob.heartbeat_at == None
+                        )
+                    )
+                )
+            ).order_by(RecommendationJob.created_at).with_for_update(skip_locked=True).first()
+
+            if not job:
+                db.rollback()
+                return None
+
+            if job.status == "running" and (job.attempts or 0) >= settings.JOB_MAX_ATTEMPTS:
+                JobService.finish_job(db, job, "Worker stopped before the job finished")
+                continue
+
+            now = datetime.utcnow()
+            job.status = "running"
+            job.started_at = now
+            job.heartbeat_at = now
+            job.attempts = (job.attempts or 0) + 1
+            db.commit()
+            db.refresh(job)
+            return job
+
+    @staticmethod
+    def touch_job(db: Session, job_id: int):
+        """Extend the lease on a running job"""
+        db.execute(
+            update(RecommendationJob).where(
+                RecommendationJob.id == job_id,
+                RecommendationJob.status == "running"
+            ).values(heartbeat_at=datetime.utcnow())
+        )
+        db.commit()
+
+    @staticmethod
+    def finish_job(db: Session, job: RecommendationJob, error: Optional[str] = None):
+        job.status = "failed" if error else "done"
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        db.commit()
+
+    @staticmethod
+    async def run_job(job_id: int):
+        """Run a claimed job with its own database session"""
+        db = SessionLocal()
+        heartbeat = asyncio.create_task(JobService._heartbeat(job_id))
+        try:
+            job = await run_in_threadpool(db.get, RecommendationJob, job_id)
+            user = await run_in_threadpool(db.get, User, job.user_id)
+            try:
+                existing = await run_in_threadpool(
+                    GeminiService.get_or_clear_recommendations, db, user.id, job.force_regenerate
+                )
+                if not existing:
+                    await GeminiService.generate_career_recommendations_async(db, UserSnapshot.from_user(user))
+            except Exception as e:
+                print(f"Recommendation job {job_id} failed: {str(e)}")
+                await run_in_threadpool(db.rollback)
+                await run_in_threadpool(JobService.finish_job, db, job, str(e))
+                return
+            await run_in_threadpool(JobService.finish_job, db, job)
+        finally:
+            heartbeat.cancel()
+            await run_in_threadpool(db.close)
+
+    @staticmethod
+    def _touch_job_in_new_session(job_id: int):
+        db = SessionLocal()
+        try:
+            JobService.touch_job(db, job_id)
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _heartbeat(job_id: int):
+        """Keep the lease on a running job alive until cancelled"""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+            try:
+                await run_in_threadpool(JobService._touch_job_in_new_session, job_id)
+            except Exception as e:
+                print(f"Error sending heartbeat for recommendation job {job_id}: {str(e)}")
+
+    @staticmethod
+    def _claim_next_job_id() -> Optional[int]:
+        db = SessionLocal()
+        try:
+            job = JobService.claim_next_job(db)
+            return job.id if job else None
+        finally:
+            db.close()
+
+    @staticmethod
+    async def worker_loop(stop_event: asyncio.Event):
+        """Poll for queued jobs until ``stop_event`` is set"""
+        while not stop_event.is_set():
+            try:
+                job_id = await run_in_threadpool(JobService._claim_next_job_id)
+            except Exception as e:
+                print(f"Error claiming recommendation job: {str(e)}")
+                job_id = None
+
+            if job_id is not None:
+                try:
+                    await JobService.run_job(job_id)
+                except Exception as e:
+                    # The job stays running and is reclaimed when its lease expires
+                    print(f"Error running recommendation job {job_id}: {str(e)}")
+                continue
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+class JobWorkerPool:
+    """In-process asyncio workers draining the recommendation job table"""
+
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+        self._stop_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        self._stop_event = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(JobService.worker_loop(self._stop_event))
+            for _ in range(self.worker_count)
+        ]
+
+    async def stop(self):
+        if self._stop_event is None:
+            return
+        self._stop_event.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+job_worker_pool = JobWorkerPool(settings.JOB_WORKER_COUNT)
@@ -0,0 +1,157 @@
+import json
+from typing import Any, Dict, List
+
+PAYLOAD_KEY = "recommendations"
+
+# Characters that can start a JSON value, telling a JSON array from prose in brackets
+_VALUE_START = set('"{[]-0123456789tfn')
+
+class JsonArrayStreamParser:
+    """Incrementally split a streamed JSON array into its object elements.
+
+    Text is fed in arbitrary chunks; ``feed`` returns every top-level object
+    of the array that was completed by that chunk. The parser is tolerant of
+    what LLMs wrap around their JSON: prose or markdown fences before the
+    array are ignored, a ``[`` that does not open an array of objects (like
+    "[see below]") is skipped, and elements that fail to decode are counted
+    in ``skipped`` instead of aborting the whole parse.
+
+    Only a top-level array, or the value of a top-level ``recommendations``
+    key, is taken as the payload. Structure before it is tracked so an
+    object array nested in something else (a recommendation's
+    ``skill_gaps``, say) is never mistaken for it.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._position = 0
+        self._in_array = False
+        self._array_confirmed = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element_start = None
+        self.skipped = 0
+        # Structure of the JSON (if any) before the payload array
+        self._prelude_stack: List[str] = []
+        self._prelude_in_string = False
+        self._prelude_escaped = False
+        self._prelude_string = ""
+        self._prelude_key = None
+        self._prelude_after_colon = False
+        self._prelude_bracket_pending = False
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        self._buffer += chunk
+        completed = []
+
+        while self._position < len(self._buffer) and not self._finished:
+            char = self._buffer[self._position]
+
+            if not self._in_array:
+                if self._scan_prelude_char(char):
+                    self._in_array = True
+                    self._array_confirmed = False
+            elif not self._array_confirmed and self._depth == 0 and not char.isspace():
+                # Only an array whose first element is an object is the payload
+                if char == "{":
+                    self._array_confirmed = True
+                elif char == "]":
+                    self._finished = True
+                else:
+                    # Rescan this character as part of whatever the ``[`` opened
+                    self._in_array = False
+                    self._prelude_bracket_pending = True
+                    continue
+            if self._in_array and self._array_confirmed and not self._finished:
+                self._scan_element_char(char, completed)
+
+            self._position += 1
+
+        # Drop text that can no longer be part of a pending element
+        discard = self._element_start if self._element_start is not None else self._position
+        self._buffer = self._buffer[discard:]
+        self._position -= discard
+        if self._element_start is not None:
+            self._element_start = 0
+
+        return completed
+
+    def _scan_prelude_char(self, char: str) -> bool:
+        """Track structure before the payload; True if ``char`` opens the payload array"""
+        if self._prelude_in_string:
+            if self._prelude_escaped:
+                self._prelude_escaped = False
+                self._prelude_string += char
+            elif char == "\\":
+                self._prelude_escaped = True
+            elif char == '"':
+                self._prelude_in_string = False
+                self._prelude_key = self._prelude_string
+            else:
+                self._prelude_string += char
+            return False
+        if char.isspace():
+            return False
+
+        if self._prelude_bracket_pending:
+            # A skipped ``[`` only nests what follows if it opened real JSON
+            self._prelude_bracket_pending = False
+            if char in _VALUE_START:
+                self._prelude_stack.append("[")
+
+        if char == '"':
+            self._prelude_in_string = True
+            self._prelude_string = ""
+            return False
+        if char == ":":
+            self._prelude_after_colon = self._prelude_key is not None
+            return False
+        if char == "[":
+            at_top_level = not self._prelude_stack
+            under_payload_key = (
+                self._prelude_stack == ["{"] and self._prelude_after_colon and self._prelude_key == PAYLOAD_KEY
+            )
+            if at_top_level or under_payload_key:
+                return True
+            self._prelude_bracket_pending = True
+        elif char == "{":
+            self._prelude_stack.append("{")
+        elif char in "}]":
+            opener = "{" if char == "}" else "["
+            if self._prelude_stack and self._prelude_stack[-1] == opener:
+                self._prelude_stack.pop()
+
+        self._prelude_key = None
+        self._prelude_after_colon = False
+        return False
+
+    def _scan_element_char(self, char: str, completed: List[Dict[str, Any]]):
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+        elif char == '"':
+            self._in_string = True
+        elif char == "{":
+            if self._depth == 0:
+                self._element_start = self._position
+            self._depth += 1
+        elif char == "}" and self._depth > 0:
+            self._depth -= 1
+            if self._depth == 0:
+                try:
+                    completed.append(json.loads(self._buffer[self._element_start:self._position + 1]))
+                except json.JSONDecodeError:
+                    self.skipped += 1
+                self._element_start = None
+        elif char == "]" and self._depth == 0:
+            self._finished = True
@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models.onboarding import OnboardingData
 from app.models.career import CareerRecommendation
@@ -29,13 +31,13 @@ class OnboardingService:
         return int((filled_fields / total_fields) * 100)
     
     @staticmethod
-    def create_or_update_onboarding(
-        db: Session,
+    async def create_or_update_onboarding(
+        db: AsyncSession,
         user_id: int,
         onboarding_data: OnboardingDataCreate | OnboardingDataUpdate
     ) -> OnboardingData:
         # Check if onboarding data exists
-        db_data = db.query(OnboardingData).filter(OnboardingData.user_id == user_id).first()
+        db_data = await db.scalar(select(OnboardingData).filter(OnboardingData.user_id == user_id))
         
         if db_data:
             # Update existing data
@@ -47,11 +49,14 @@ class OnboardingService:
             db.add(db_data)
 
         # Clear existing recommendations whenever onboarding data changes
-        existing_recommendations = db.query(CareerRecommendation).filter(
-            CareerRecommendation.user_id == user_id
-        ).all()
+        # (children are loaded up front so the delete cascade needs no lazy loads)
+        existing_recommendations = await db.scalars(
+            select(CareerRecommendation).filter(
+                CareerRecommendation.user_id == user_id
+            ).options(selectinload(CareerRecommendation.skill_gaps), selectinload(CareerRecommendation.learning_roadmaps))
+        )
         for recommendation in existing_recommendations:
-            db.delete(recommendation)
+            await db.delete(recommendation)
         
         # Calculate completeness
         db_data.profile_completeness = OnboardingService.calculate_completeness(db_data)
@@ -60,13 +65,13 @@ class OnboardingService:
         if db_data.step_completed is not None and db_data.step_completed >= 4:
             db_data.is_completed = True
         
-        db.commit()
-        db.refresh(db_data)
+        await db.commit()
+        await db.refresh(db_data)
         return db_data
     
     @staticmethod
-    def get_onboarding_data(db: Session, user_id: int) -> OnboardingData:
-        data = db.query(OnboardingData).filter(OnboardingData.user_id == user_id).first()
+    async def get_onboarding_data(db: AsyncSession, user_id: int) -> OnboardingData:
+        data = await db.scalar(select(OnboardingData).filter(OnboardingData.user_id == user_id))
         if not data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
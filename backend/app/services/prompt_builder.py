@@ -0,0 +1,92 @@
+import json
+from typing import Any, Dict
+
+# Bump whenever the prompt template changes so cached responses are not reused
+PROMPT_VERSION = "2"
+
+# Static instructions are built once and placed ahead of the per-user profile,
+# so every request shares the same prompt prefix.
+RECOMMENDATION_INSTRUCTIONS = """You are an expert career counselor. Analyze the user profile at the end of this message and provide 3-5 HIGHLY SPECIFIC personalized career recommendations.
+
+IMPORTANT INSTRUCTIONS FOR CAREER TITLES:
+- Be VERY SPECIFIC with career titles. Don't use generic terms like "Software Engineer" or "Accountant"
+- For Computer Science/IT field: Use titles like "Backend Developer", "Frontend Developer", "Full Stack Developer", "DevOps Engineer", "Machine Learning Engineer", "Computer Vision Engineer", "Data Scientist", "Mobile App Developer", "Cloud Architect"
+- For Accounting/Finance field: Use titles like "Tax Accountant", "Forensic Accountant", "Management Accountant", "Financial Analyst", "Auditor", "Bookkeeper", "Payroll Specialist"
+- For Engineering fields: Use titles like "Structural Engineer", "Electrical Systems Engineer", "Power Systems Engineer", "Civil Infrastructure Engineer", "HVAC Engineer"
+- For Business/Management: Use titles like "Business Analyst", "Operations Manager", "Product Manager", "HR Manager", "Marketing Manager"
+- Match the specificity to the user's field of study and interests
+
+For each career recommendation, provide:
+1. SPECIFIC Career title (not generic)
+2. Detailed description (2-3 sentences)
+3. Match score (0-100) based on their profile
+4. Reasoning for the recommendation
+5. Required skills (list of 5-8 skills)
+6. Growth potential (High/Medium/Low)
+7. Salary range (e.g., "$60,000 - $90,000")
+8. Work environment description
+9. Top 5 skill gaps with:
+   - Skill name
+   - Current level (beginner/intermediate/advanced or "not present")
+   - Required level (intermediate/advanced/expert)
+   - Priority (high/medium/low)
+   - Estimated time to acquire
+10. Learning roadmap with 3-4 phases:
+   - Phase name
+   - Duration
+   - Learning objectives (3-5 items)
+   - Resources (courses, books, certifications)
+
+Return ONLY a valid JSON array with this exact structure:
+[
+  {
+    "career_title": "...",
+    "career_description": "...",
+    "match_score": 85,
+    "reasoning": "...",
+    "required_skills": ["skill1", "skill2", ...],
+    "growth_potential": "High",
+    "salary_range": "$...",
+    "work_environment": "...",
+    "skill_gaps": [
+      {
+        "skill_name": "...",
+        "current_level": "...",
+        "required_level": "...",
+        "priority": "high",
+        "estimated_time": "3 months"
+      }
+    ],
+    "learning_roadmap": [
+      {
+        "phase": "Phase 1: Foundations",
+        "duration": "3 months",
+        "objectives": ["...", "..."],
+        "resources": [{"type": "course", "name": "...", "provider": "..."}, ...]
+      }
+    ]
+  }
+]
+"""
+
+def compact_profile(value: Any) -> Any:
+    """Drop empty values and stray whitespace from a profile"""
+    if isinstance(value, dict):
+        compacted = {key: compact_profile(item) for key, item in value.items()}
+        return {key: item for key, item in compacted.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [compact_profile(item) for item in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+def encode_profile(profile: Dict[str, Any]) -> str:
+    """Minified, null-pruned JSON encoding of a profile"""
+    return json.dumps(compact_profile(profile), separators=(",", ":"), ensure_ascii=False, default=str)
+
+def build_recommendation_prompt(profile: Dict[str, Any]) -> str:
+    return f"{RECOMMENDATION_INSTRUCTIONS}\nUser Profile:\n{encode_profile(profile)}\n"
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English text)"""
+    return (len(text) + 3) // 4
@@ -0,0 +1,76 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple
+from pydantic import TypeAdapter
+from app.core.config import settings
+from app.models.quiz import QuizQuestion
+from app.schemas.quiz import QuizQuestionResponse
+
+_questions_adapter = TypeAdapter(List[QuizQuestionResponse])
+
+class CatalogEntry(NamedTuple):
+    version: int
+    expires_at: float
+    etag: str
+    body: bytes
+
+
+class QuizCatalogCache:
+    """Pre-serialized active quiz questions keyed by (field_of_study, section).
+
+    Admin edits call ``bump_version`` so this process reloads on the next
+    request; other processes pick the change up once their entries expire.
+    ETags are derived from the serialized body, so they agree across processes.
+    The section comes from the query string, so entries are kept in an LRU
+    capped at ``max_entries``.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: "OrderedDict[Tuple[Optional[str], Optional[str]], CatalogEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bump_version(self):
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    async def get(
+        self,
+        field_of_study: Optional[str],
+        section: Optional[str],
+        load: Callable[[], Awaitable[List[QuizQuestion]]]
+    ) -> CatalogEntry:
+        key = (field_of_study, section)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == self.version and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry
+
+        version = self.version
+        questions = await load()
+        body = _questions_adapter.dump_json([QuizQuestionResponse.from_orm(q) for q in questions])
+        entry = CatalogEntry(
+            version=version,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            body=body
+        )
+        with self._lock:
+            # Don't store a load that raced with an admin edit
+            if version == self.version:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+
+quiz_catalog = QuizCatalogCache(
+    settings.QUIZ_CATALOG_CACHE_TTL_SECONDS, settings.QUIZ_CATALOG_CACHE_MAX_ENTRIES
+)
@@ -1,6 +1,9 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from datetime import datetime
+from collections import Counter
+from typing import List, Mapping, Optional, Sequence
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, or_, select
 from fastapi import HTTPException, status
 from app.models.quiz import QuizQuestion, QuizAnswer, QuizSubmission
 from app.models.onboarding import OnboardingData
@@ -8,23 +11,24 @@ from app.schemas.quiz import QuizAnswerCreate
 
 class QuizService:
     @staticmethod
-    def get_all_questions(db: Session, section: Optional[str] = None) -> List[QuizQuestion]:
-        query = db.query(QuizQuestion).filter(QuizQuestion.is_active == True)
+    async def get_all_questions(db: AsyncSession, section: Optional[str] = None) -> List[QuizQuestion]:
+        query = select(QuizQuestion).filter(QuizQuestion.is_active == True)
         if section:
             query = query.filter(QuizQuestion.section == section)
-        return query.order_by(QuizQuestion.order).all()
+        return (await db.scalars(query.order_by(QuizQuestion.order))).all()
     
     @staticmethod
-    def get_questions_for_user(db: Session, user_id: int, section: Optional[str] = None) -> List[QuizQuestion]:
-        """Get questions filtered by user's field of study"""
-        # Get user's field of study from onboarding
-        onboarding = db.query(OnboardingData).filter(OnboardingData.user_id == user_id).first()
-        field_of_study = onboarding.field_of_study if onboarding else None
-        
+    async def get_user_field_of_study(db: AsyncSession, user_id: int) -> Optional[str]:
+        return await db.scalar(
+            select(OnboardingData.field_of_study).filter(OnboardingData.user_id == user_id)
+        )
+    
+    @staticmethod
+    async def get_questions_for_field(db: AsyncSession, field_of_study: Optional[str], section: Optional[str] = None) -> List[QuizQuestion]:
         # Query for questions that either:
         # 1. Apply to all fields (field_of_study is NULL)
         # 2. Match the user's specific field of study
-        query = db.query(QuizQuestion).filter(
+        query = select(QuizQuestion).filter(
             QuizQuestion.is_active == True,
             or_(
                 QuizQuestion.field_of_study == None,
@@ -35,87 +39,150 @@ class QuizService:
         if section:
             query = query.filter(QuizQuestion.section == section)
         
-        return query.order_by(QuizQuestion.order).all()
+        return (await db.scalars(query.order_by(QuizQuestion.order))).all()
     
     @staticmethod
-    def get_or_create_submission(db: Session, user_id: int) -> QuizSubmission:
-        submission = db.query(QuizSubmission).filter(
+    async def get_questions_for_user(db: AsyncSession, user_id: int, section: Optional[str] = None) -> List[QuizQuestion]:
+        """Get questions filtered by user's field of study"""
+        field_of_study = await QuizService.get_user_field_of_study(db, user_id)
+        return await QuizService.get_questions_for_field(db, field_of_study, section)
+    
+    @staticmethod
+    async def get_or_create_submission(db: AsyncSession, user_id: int, commit: bool = True, for_update: bool = False) -> QuizSubmission:
+        query = select(QuizSubmission).filter(
             QuizSubmission.user_id == user_id
-        ).order_by(QuizSubmission.created_at.desc()).first()
+        ).order_by(QuizSubmission.created_at.desc()).limit(1)
+        if for_update:
+            query = query.with_for_update()
+        submission = await db.scalar(query)
         
         if not submission:
-            total_questions = db.query(func.count(QuizQuestion.id)).filter(
-                QuizQuestion.is_active == True
-            ).scalar()
+            total_questions = await db.scalar(
+                select(func.count(QuizQuestion.id)).filter(QuizQuestion.is_active == True)
+            )
             
             submission = QuizSubmission(
                 user_id=user_id,
                 total_questions=total_questions
             )
             db.add(submission)
-            db.commit()
-            db.refresh(submission)
+            if commit:
+                await db.commit()
+                await db.refresh(submission)
+            else:
+                await db.flush()
         
         return submission
     
     @staticmethod
-    def save_answer(db: Session, user_id: int, answer_data: QuizAnswerCreate) -> QuizAnswer:
-        # Check if question exists
-        question = db.query(QuizQuestion).filter(QuizQuestion.id == answer_data.question_id).first()
-        if not question:
+    async def save_answer(db: AsyncSession, user_id: int, answer_data: QuizAnswerCreate) -> QuizAnswer:
+        answers = await QuizService.save_answers(db, user_id, [answer_data])
+        return answers[0]
+    
+    @staticmethod
+    async def save_answers(db: AsyncSession, user_id: int, answers: Sequence[QuizAnswerCreate]) -> List[QuizAnswer]:
+        """Upsert many answers with one statement and a single commit"""
+        # Later answers to the same question win; ON CONFLICT cannot touch a row twice
+        answer_by_question = {answer.question_id: answer.answer for answer in answers}
+        question_ids = list(answer_by_question)
+        
+        # Lock the submission first so concurrent saves for this user queue up
+        # here; otherwise two of them could both classify the same answer as
+        # new, or both read the counters before either writes them back
+        submission = await QuizService.get_or_create_submission(db, user_id, commit=False, for_update=True)
+        
+        # One query validates the ids and tells new answers from updated ones
+        rows = (await db.execute(
+            select(QuizQuestion.id, QuizQuestion.section, QuizAnswer.id).outerjoin(
+                QuizAnswer,
+                and_(QuizAnswer.question_id == QuizQuestion.id, QuizAnswer.user_id == user_id)
+            ).filter(QuizQuestion.id.in_(question_ids))
+        )).all()
+        found_ids = {question_id for question_id, _, _ in rows}
+        missing_ids = [question_id for question_id in question_ids if question_id not in found_ids]
+        if missing_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Question not found"
-            )
-        
-        # Check if answer already exists
-        existing_answer = db.query(QuizAnswer).filter(
-            QuizAnswer.user_id == user_id,
-            QuizAnswer.question_id == answer_data.question_id
-        ).first()
-        
-        if existing_answer:
-            existing_answer.answer = answer_data.answer
-            db_answer = existing_answer
-        else:
-            db_answer = QuizAnswer(
-                user_id=user_id,
-                question_id=answer_data.question_id,
-                answer=answer_data.answer
+                detail="Question not found" if len(missing_ids) == 1 else f"Questions not found: {missing_ids}"
             )
-            db.add(db_answer)
-        
-        db.commit()
-        db.refresh(db_answer)
-        
-        # Update submission progress
-        QuizService.update_submission_progress(db, user_id)
-        
-        return db_answer
+        new_answers_by_section = Counter(section for _, section, answer_id in rows if answer_id is None)
+        
+        now = datetime.utcnow()
+        insert = postgresql.insert if db.bind.dialect.name == "postgresql" else sqlite.insert
+        statement = insert(QuizAnswer).values([
+            {
+                "user_id": user_id,
+                "question_id": question_id,
+                "answer": answer,
+                "created_at": now,
+                "updated_at": now
+            }
+            for question_id, answer in answer_by_question.items()
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[QuizAnswer.user_id, QuizAnswer.question_id],
+            set_={"answer": statement.excluded.answer, "updated_at": now}
+        ).returning(QuizAnswer)
+        saved = (await db.scalars(statement, execution_options={"populate_existing": True})).all()
+        
+        await QuizService.record_new_answers(db, submission, new_answers_by_section)
+        await db.commit()
+        
+        order = {question_id: index for index, question_id in enumerate(question_ids)}
+        return sorted(saved, key=lambda saved_answer: order[saved_answer.question_id])
     
     @staticmethod
-    def update_submission_progress(db: Session, user_id: int):
-        submission = QuizService.get_or_create_submission(db, user_id)
-        
-        # Count answered questions
-        answered_count = db.query(func.count(QuizAnswer.id)).filter(
-            QuizAnswer.user_id == user_id
-        ).scalar()
-        
-        submission.answered_questions = answered_count
-        
-        # Get completed sections
-        completed_sections = db.query(QuizQuestion.section).join(
-            QuizAnswer, QuizQuestion.id == QuizAnswer.question_id
-        ).filter(QuizAnswer.user_id == user_id).distinct().all()
-        
-        submission.completed_sections = [section[0] for section in completed_sections]
-        
-        db.commit()
+    async def record_new_answers(db: AsyncSession, submission: QuizSubmission, new_answers_by_section: Mapping[str, int]):
+        """Bump the submission's progress counters for newly answered questions.
+        
+        The caller must hold the submission's row lock (see save_answers).
+        Updated answers do not change progress. Submissions without section
+        counters yet (created before they existed) get a full recount instead.
+        """
+        if submission.section_answer_counts is None:
+            await QuizService.update_submission_progress(db, submission.user_id, commit=False)
+            return
+        if not new_answers_by_section:
+            return
+        
+        section_counts = dict(submission.section_answer_counts)
+        for section, count in new_answers_by_section.items():
+            section_counts[section] = section_counts.get(section, 0) + count
+        
+        submission.section_answer_counts = section_counts
+        submission.answered_questions = (submission.answered_questions or 0) + sum(new_answers_by_section.values())
+        submission.completed_sections = [section for section, count in section_counts.items() if count > 0]
+    
+    @staticmethod
+    async def update_submission_progress(db: AsyncSession, user_id: int, commit: bool = True):
+        """Recount progress from the user's answers"""
+        submission = await QuizService.get_or_create_submission(db, user_id, commit=commit)
+        
+        section_counts = dict((await db.execute(
+            select(QuizQuestion.section, func.count(QuizAnswer.id)).join(
+                QuizAnswer, QuizQuestion.id == QuizAnswer.question_id
+            ).filter(QuizAnswer.user_id == user_id).group_by(QuizQuestion.section)
+        )).all())
+        
+        submission.section_answer_counts = section_counts
+        submission.answered_questions = sum(section_counts.values())
+        submission.completed_sections = list(section_counts)
+        
+        if commit:
+            await db.commit()
+    
+    @staticmethod
+    async def reconcile_progress(db: AsyncSession, user_id: int) -> bool:
+        """Recount a user's progress; returns True if the stored counters had drifted"""
+        submission = await QuizService.get_or_create_submission(db, user_id, commit=False, for_update=True)
+        before = (submission.answered_questions, dict(submission.section_answer_counts or {}))
+        await QuizService.update_submission_progress(db, user_id, commit=False)
+        await db.commit()
+        return before != (submission.answered_questions, submission.section_answer_counts)
     
     @staticmethod
-    def submit_quiz(db: Session, user_id: int) -> QuizSubmission:
-        submission = QuizService.get_or_create_submission(db, user_id)
+    async def submit_quiz(db: AsyncSession, user_id: int) -> QuizSubmission:
+        submission = await QuizService.get_or_create_submission(db, user_id)
         
         if submission.is_completed:
             raise HTTPException(
@@ -130,15 +197,14 @@ class QuizService:
                 detail="Please answer at least 70% of questions before submitting"
             )
         
-        from datetime import datetime
         submission.is_completed = True
         submission.submitted_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(submission)
+        await db.commit()
+        await db.refresh(submission)
         
         return submission
     
     @staticmethod
-    def get_user_answers(db: Session, user_id: int) -> List[QuizAnswer]:
-        return db.query(QuizAnswer).filter(QuizAnswer.user_id == user_id).all()
+    async def get_user_answers(db: AsyncSession, user_id: int) -> List[QuizAnswer]:
+        return (await db.scalars(select(QuizAnswer).filter(QuizAnswer.user_id == user_id))).all()
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Optional
+from pydantic import ValidationError
+from app.schemas.career import CareerRecommendationCreate, SkillGapBase, LearningRoadmapBase
+from app.services.json_stream import JsonArrayStreamParser
+
+def validate_recommendation(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate one recommendation from Gemini.
+
+    Returns the item with every schema field present, keeping only the
+    skill gaps and roadmap phases that validate, or ``None`` if the
+    recommendation itself is unusable.
+    """
+    try:
+        recommendation = CareerRecommendationCreate.model_validate(item)
+    except ValidationError:
+        return None
+
+    skill_gaps = []
+    for gap in item.get("skill_gaps") or []:
+        try:
+            skill_gaps.append(SkillGapBase.model_validate(gap).model_dump())
+        except ValidationError:
+            continue
+
+    learning_roadmap = []
+    for phase in item.get("learning_roadmap") or []:
+        try:
+            learning_roadmap.append(LearningRoadmapBase.model_validate(phase).model_dump())
+        except ValidationError:
+            continue
+
+    return {
+        **item,
+        **recommendation.model_dump(exclude={"ai_analysis"}),
+        "skill_gaps": skill_gaps,
+        "learning_roadmap": learning_roadmap,
+    }
+
+
+class RecommendationExtractor:
+    """Pull validated recommendations out of a (possibly chunked) Gemini response"""
+
+    def __init__(self):
+        self._parser = JsonArrayStreamParser()
+        self.rejected = 0
+
+    @property
+    def complete(self) -> bool:
+        """True once the whole array was read and every element was usable"""
+        return self._parser.finished and self._parser.skipped == 0 and self.rejected == 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        valid = []
+        for item in self._parser.feed(chunk):
+            recommendation = validate_recommendation(item)
+            if recommendation is None:
+                self.rejected += 1
+            else:
+                valid.append(recommendation)
+        return valid
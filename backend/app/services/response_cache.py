@@ -0,0 +1,130 @@
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.cache import LLMResponseCache
+from app.services.prompt_builder import compact_profile
+
+def make_cache_key(profile: Dict[str, Any], prompt_version: str, model_name: str) -> str:
+    """Content-addressed key for a profile, prompt template version and model"""
+    fingerprint = json.dumps(
+        {
+            "profile": compact_profile(profile),
+            "prompt_version": prompt_version,
+            "model": model_name,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Interface for parsed Gemini response caches.
+
+    Entries are stored serialized so callers always get a fresh copy.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: List[Dict[str, Any]], model_name: str):
+        ...
+
+
+class NullResponseCache(ResponseCache):
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        return None
+
+    def set(self, key: str, value: List[Dict[str, Any]], model_name: str):
+        pass
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Per-process LRU cache with a TTL"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(payload)
+
+    def set(self, key: str, value: List[Dict[str, Any]], model_name: str):
+        payload = json.dumps(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DatabaseResponseCache(ResponseCache):
+    """Cache shared across replicas through the llm_response_cache table"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        db = SessionLocal()
+        try:
+            entry = db.query(LLMResponseCache).filter(
+                LLMResponseCache.cache_key == key,
+                LLMResponseCache.expires_at > datetime.utcnow()
+            ).first()
+            return json.loads(entry.payload) if entry else None
+        finally:
+            db.close()
+
+    def set(self, key: str, value: List[Dict[str, Any]], model_name: str):
+        db = SessionLocal()
+        try:
+            db.merge(LLMResponseCache(
+                cache_key=key,
+                model_name=model_name,
+                payload=json.dumps(value),
+                created_at=datetime.utcnow(),
+                expires_at=datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            ))
+            db.commit()
+        except Exception as e:
+            print(f"Error writing response cache: {str(e)}")
+            db.rollback()
+        finally:
+            db.close()
+
+
+def create_response_cache(backend: str) -> ResponseCache:
+    if backend == "memory":
+        return InMemoryResponseCache(
+            settings.GEMINI_RESPONSE_CACHE_MAX_ENTRIES,
+            settings.GEMINI_RESPONSE_CACHE_TTL_SECONDS
+        )
+    if backend == "database":
+        return DatabaseResponseCache(settings.GEMINI_RESPONSE_CACHE_TTL_SECONDS)
+    if backend == "none":
+        return NullResponseCache()
+    raise ValueError(f"Unknown response cache backend: {backend}")
+
+
+response_cache = create_response_cache(settings.GEMINI_RESPONSE_CACHE_BACKEND)
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.models.onboarding import OnboardingData
+from app.models.quiz import QuizQuestion, QuizSubmission
+from app.models.career import CareerRecommendation
+from app.models.learning import LearningMaterial
+from app.models.stats import AdminStatsSummary
+
+SUMMARY_ID = 1
+
+# pg_advisory_xact_lock key so only one process rebuilds the summary at a time
+REFRESH_LOCK_ID = 720341
+
+COUNTER_FIELDS = (
+    "total_users",
+    "active_users",
+    "completed_onboarding",
+    "completed_quiz",
+    "total_learning_materials",
+    "total_recommendations",
+    "total_quiz_questions",
+)
+
+class StatsService:
+    @staticmethod
+    def compute_stats(db: Session) -> Dict[str, Any]:
+        """Compute every dashboard counter in a single round-trip.
+
+        Each table is aggregated once in its own CTE; the per-field counts are
+        left-joined onto the one-row counters, so the result has one row per
+        field of study (or a single row when there are none).
+        """
+        user_counts = select(
+            func.count(User.id).label("total_users"),
+            func.count(User.id).filter(User.is_active == True).label("active_users")
+        ).cte("user_counts")
+        onboarding_counts = select(
+            func.count(OnboardingData.id).filter(OnboardingData.is_completed == True).label("completed_onboarding")
+        ).cte("onboarding_counts")
+        quiz_counts = select(
+            func.count(QuizSubmission.id).filter(QuizSubmission.is_completed == True).label("completed_quiz")
+        ).cte("quiz_counts")
+        material_counts = select(
+            func.count(LearningMaterial.id).filter(LearningMaterial.is_active == True).label("total_learning_materials")
+        ).cte("material_counts")
+        recommendation_counts = select(
+            func.count(CareerRecommendation.id).label("total_recommendations")
+        ).cte("recommendation_counts")
+        question_counts = select(
+            func.count(QuizQuestion.id).filter(QuizQuestion.is_active == True).label("total_quiz_questions")
+        ).cte("question_counts")
+        field_counts = select(
+            OnboardingData.field_of_study,
+            func.count(OnboardingData.id).label("users")
+        ).filter(
+            OnboardingData.field_of_study != None
+        ).group_by(OnboardingData.field_of_study).cte("field_counts")
+
+        counters = [
+            user_counts.c.total_users,
+            user_counts.c.active_users,
+            onboarding_counts.c.completed_onboarding,
+            quiz_counts.c.completed_quiz,
+            material_counts.c.total_learning_materials,
+            recommendation_counts.c.total_recommendations,
+            question_counts.c.total_quiz_questions,
+        ]
+        rows = db.execute(
+            select(*counters, field_counts.c.field_of_study, field_counts.c.users)
+            .select_from(user_counts)
+            .join(onboarding_counts, true())
+            .join(quiz_counts, true())
+            .join(material_counts, true())
+            .join(recommendation_counts, true())
+            .join(question_counts, true())
+            .outerjoin(field_counts, true())
+        ).all()
+
+        first = rows[0]
+        stats = {name: getattr(first, name) or 0 for name in COUNTER_FIELDS}
+        stats["users_by_field"] = {row.field_of_study: row.users for row in rows if row.field_of_study}
+        return stats
+
+    @staticmethod
+    def refresh_summary(db: Session, min_age_seconds: float = 0) -> Optional[AdminStatsSummary]:
+        """Rebuild the summary row unless another process is rebuilding it or
+        has done so within ``min_age_seconds``; returns None when skipped.
+        """
+        if db.get_bind().dialect.name == "postgresql" and not db.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID))
+        ):
+            db.rollback()
+            return None
+        
+        current = db.get(AdminStatsSummary, SUMMARY_ID)
+        if (
+            min_age_seconds and current is not None and current.refreshed_at is not None
+            and datetime.utcnow() - current.refreshed_at < timedelta(seconds=min_age_seconds)
+        ):
+            db.rollback()
+            return None
+        
+        stats = StatsService.compute_stats(db)
+        summary = db.merge(AdminStatsSummary(id=SUMMARY_ID, refreshed_at=datetime.utcnow(), **stats))
+        db.commit()
+        return summary
+
+    @staticmethod
+    def get_summary(db: Session) -> Dict[str, Any]:
+        """Read the materialized counters, computing them live before the first refresh"""
+        summary = db.get(AdminStatsSummary, SUMMARY_ID)
+        if summary is None or summary.refreshed_at is None:
+            return {**StatsService.compute_stats(db), "refreshed_at": datetime.utcnow()}
+        return {
+            **{name: getattr(summary, name) for name in COUNTER_FIELDS},
+            "users_by_field": summary.users_by_field or {},
+            "refreshed_at": summary.refreshed_at,
+        }
+
+    @staticmethod
+    def _refresh_in_new_session(min_age_seconds: float):
+        db = SessionLocal()
+        try:
+            StatsService.refresh_summary(db, min_age_seconds)
+        finally:
+            db.close()
+
+
+class StatsRefresher:
+    """Periodically rebuilds the admin stats summary row.
+
+    Every API process runs one; a refresh is skipped while the row is less
+    than half an interval old, so the processes share the work instead of
+    each running the full aggregate.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._stop_event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.interval_seconds <= 0:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                await run_in_threadpool(StatsService._refresh_in_new_session, self.interval_seconds / 2)
+            except Exception as e:
+                print(f"Error refreshing admin stats: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stop_event.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+admin_stats_refresher = StatsRefresher(settings.ADMIN_STATS_REFRESH_SECONDS)
@@ -0,0 +1,69 @@
+from typing import List
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql.elements import ColumnElement
+from app.models.user import User
+
+# pg_trgm cannot index terms shorter than a trigram; those match by prefix only
+MIN_TRIGRAM_TERM_LENGTH = 3
+
+LIKE_ESCAPE = "/"
+
+def _escape_like(term: str) -> str:
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class UserSearch:
+    """Admin user search by email or name.
+
+    On PostgreSQL, substring and fuzzy matches are served by the pg_trgm GIN
+    indexes from migration 010 and short terms by the lower() prefix indexes.
+    Other databases (SQLite in development) get the same filters as plain
+    LIKE scans.
+    """
+
+    def __init__(self, term: str, dialect_name: str):
+        self.term = term.strip().lower()
+        self.use_trigrams = dialect_name == "postgresql"
+
+    @property
+    def prefix_only(self) -> bool:
+        return len(self.term) < MIN_TRIGRAM_TERM_LENGTH
+
+    def filter(self) -> ColumnElement:
+        escaped = _escape_like(self.term)
+        email = func.lower(User.email)
+        full_name = func.lower(User.full_name)
+
+        if self.prefix_only:
+            return or_(
+                email.like(f"{escaped}%", escape=LIKE_ESCAPE),
+                full_name.like(f"{escaped}%", escape=LIKE_ESCAPE)
+            )
+
+        conditions = [
+            User.email.ilike(f"%{escaped}%", escape=LIKE_ESCAPE),
+            User.full_name.ilike(f"%{escaped}%", escape=LIKE_ESCAPE)
+        ]
+        if self.use_trigrams:
+            # Typo-tolerant name matches via the pg_trgm similarity operator
+            conditions.append(User.full_name.op("%")(self.term))
+        return or_(*conditions)
+
+    def order_by(self) -> List[ColumnElement]:
+        """Prefix matches first, then (with pg_trgm) the closest matches"""
+        escaped = _escape_like(self.term)
+        ordering = [
+            case(
+                (or_(
+                    func.lower(User.email).like(f"{escaped}%", escape=LIKE_ESCAPE),
+                    func.lower(User.full_name).like(f"{escaped}%", escape=LIKE_ESCAPE)
+                ), 0),
+                else_=1
+            )
+        ]
+        if self.use_trigrams:
+            ordering.append(func.greatest(
+                func.similarity(User.email, self.term),
+                func.coalesce(func.similarity(User.full_name, self.term), 0)
+            ).desc())
+        return ordering
@@ -0,0 +1,105 @@
+import asyncio
+import time
+import pytest
+from app.services import gemini_service
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.gemini_service import GeminiService
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+class StallingModel:
+    """Stand-in for genai.GenerativeModel whose calls never finish on their own"""
+
+    def __init__(self, model_name):
+        pass
+
+    async def generate_content_async(self, prompt, stream=False):
+        if not stream:
+            await asyncio.sleep(3600)
+
+        async def chunks():
+            yield Chunk("[")
+            await asyncio.sleep(3600)
+
+        return chunks()
+
+@pytest.fixture
+def breaker(monkeypatch):
+    circuit = CircuitBreaker(
+        name="test",
+        window_seconds=60,
+        minimum_calls=5,
+        failure_rate_threshold=0.5,
+        slow_call_seconds=60,
+        open_seconds=60,
+        half_open_max_calls=1
+    )
+    monkeypatch.setattr(gemini_service, "gemini_circuit_breaker", circuit)
+    monkeypatch.setattr(gemini_service.genai, "GenerativeModel", StallingModel)
+    monkeypatch.setattr(gemini_service.settings, "GEMINI_REQUEST_TIMEOUT_SECONDS", 0.2)
+    return circuit
+
+def saturate(monkeypatch):
+    monkeypatch.setattr(gemini_service, "generation_semaphore", asyncio.Semaphore(0))
+
+async def first_chunk(prompt):
+    async for chunk in GeminiService.stream_gemini_async(prompt):
+        return chunk
+
+def test_call_fails_fast_when_the_limiter_is_saturated(breaker, monkeypatch):
+    saturate(monkeypatch)
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(GeminiService.call_gemini_async("prompt"))
+    assert time.monotonic() - started < 1
+    # Waiting for a slot is not a Gemini failure
+    assert breaker.snapshot()["calls"] == 0
+
+def test_stream_fails_fast_when_the_limiter_is_saturated(breaker, monkeypatch):
+    saturate(monkeypatch)
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(first_chunk("prompt"))
+    assert time.monotonic() - started < 1
+    assert breaker.snapshot()["calls"] == 0
+
+def half_open(breaker):
+    breaker.open_seconds = 0
+    breaker._open(time.monotonic())
+    assert breaker.snapshot()["state"] == CircuitBreaker.HALF_OPEN
+
+async def cancel_after_start(coroutine):
+    task = asyncio.create_task(coroutine)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+def test_cancelled_stream_probe_leaves_the_circuit_half_open(breaker):
+    half_open(breaker)
+
+    async def consume():
+        async for _ in GeminiService.stream_gemini_async("prompt"):
+            pass
+
+    asyncio.run(cancel_after_start(consume()))
+
+    snapshot = breaker.snapshot()
+    assert snapshot["state"] == CircuitBreaker.HALF_OPEN
+    assert snapshot["calls"] == 0 and snapshot["failures"] == 0
+    # The probe slot was given back, so the next call may probe again
+    assert breaker._half_open_in_flight == 0
+    assert breaker.allow_request()
+
+def test_cancelled_call_probe_leaves_the_circuit_half_open(breaker):
+    half_open(breaker)
+
+    asyncio.run(cancel_after_start(GeminiService.call_gemini_async("prompt")))
+
+    snapshot = breaker.snapshot()
+    assert snapshot["state"] == CircuitBreaker.HALF_OPEN
+    assert snapshot["calls"] == 0 and snapshot["failures"] == 0
+    assert breaker._half_open_in_flight == 0
+    assert breaker.allow_request()
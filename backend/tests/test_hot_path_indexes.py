@@ -0,0 +1,113 @@
+import pytest
+from sqlalchemy import or_, select
+from app.models import (
+    CareerRecommendation, LearningMaterial, LearningRoadmap, QuizAnswer, QuizQuestion, QuizSubmission, SkillGap, User
+)
+
+def seed(db):
+    """Users with answers, submissions and recommendations, plus active and retired catalog rows"""
+    questions = [
+        QuizQuestion(section="skills", question_text=f"Question {index}", question_type="text", order=index)
+        for index in range(5)
+    ]
+    db.add_all(questions)
+    db.add_all([
+        QuizQuestion(
+            section="interests", question_text="Retired question", question_type="text",
+            field_of_study="Computer Science", is_active=False
+        ),
+        LearningMaterial(title="Active course", url="https://example.com/a", is_active=True),
+        LearningMaterial(title="Retired course", url="https://example.com/b", is_active=False),
+    ])
+    for user_index in range(3):
+        user = User(email=f"user{user_index}@example.com", hashed_password="x", full_name=f"User {user_index}")
+        db.add(user)
+        db.flush()
+        db.add(QuizSubmission(user_id=user.id))
+        db.add_all([QuizAnswer(user_id=user.id, question_id=q.id, answer="x") for q in questions])
+        for rec_index in range(3):
+            recommendation = CareerRecommendation(
+                user_id=user.id, career_title=f"Career {rec_index}", match_score=50.0 + rec_index
+            )
+            recommendation.skill_gaps = [SkillGap(skill_name="SQL")]
+            recommendation.learning_roadmaps = [LearningRoadmap(phase="Phase 1", order=1)]
+            db.add(recommendation)
+    db.commit()
+
+def query_plan(db, statement) -> str:
+    sql = str(statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return "\n".join(row[-1] for row in rows)
+
+# (index, statement, searched, ordered): searched paths must SEARCH the index
+# rather than scan it, and ordered paths must read rows in index order
+# without a separate sort. Scanning a partial index still only reads the
+# active rows, so the catalog and material listings only need to use theirs.
+HOT_PATHS = [
+    pytest.param(
+        "ix_quiz_answers_user_id_question_id",
+        select(QuizAnswer).filter(QuizAnswer.user_id == 1),
+        True, True,
+        id="answers_by_user"
+    ),
+    pytest.param(
+        "ix_quiz_answers_user_id_question_id",
+        select(QuizAnswer.id).filter(QuizAnswer.user_id == 1, QuizAnswer.question_id.in_([1, 2])),
+        True, True,
+        id="answers_by_user_and_question"
+    ),
+    pytest.param(
+        "ix_quiz_submissions_user_id_created_at",
+        select(QuizSubmission).filter(QuizSubmission.user_id == 1).order_by(QuizSubmission.created_at.desc()).limit(1),
+        True, True,
+        id="latest_submission"
+    ),
+    pytest.param(
+        "ix_career_recommendations_user_id_match_score",
+        select(CareerRecommendation).filter(CareerRecommendation.user_id == 1).order_by(CareerRecommendation.match_score.desc()),
+        True, True,
+        id="recommendations_by_score"
+    ),
+    pytest.param(
+        "ix_skill_gaps_career_recommendation_id",
+        select(SkillGap).filter(SkillGap.career_recommendation_id.in_([1, 2, 3])),
+        True, True,
+        id="skill_gaps_by_recommendation"
+    ),
+    pytest.param(
+        "ix_learning_roadmaps_career_recommendation_id_order",
+        select(LearningRoadmap).filter(LearningRoadmap.career_recommendation_id == 1).order_by(LearningRoadmap.order),
+        True, True,
+        id="roadmap_in_order"
+    ),
+    # QuizService.get_questions_for_field
+    pytest.param(
+        "ix_quiz_questions_active_field_section_order",
+        select(QuizQuestion).filter(
+            QuizQuestion.is_active == True,
+            or_(QuizQuestion.field_of_study == None, QuizQuestion.field_of_study == "Computer Science"),
+            QuizQuestion.section == "skills"
+        ).order_by(QuizQuestion.order),
+        False, False,
+        id="active_question_catalog"
+    ),
+    # /admin/public/learning-materials
+    pytest.param(
+        "ix_learning_materials_active_created_at",
+        select(LearningMaterial).filter(LearningMaterial.is_active == True).order_by(
+            LearningMaterial.created_at.desc()
+        ).limit(50),
+        False, True,
+        id="active_learning_materials"
+    ),
+]
+
+@pytest.mark.parametrize("index_name,statement,searched,ordered", HOT_PATHS)
+def test_hot_access_paths_use_their_index(db, index_name, statement, searched, ordered):
+    seed(db)
+    plan = query_plan(db, statement)
+    assert f"USING INDEX {index_name}" in plan or f"USING COVERING INDEX {index_name}" in plan, plan
+    if searched:
+        assert "SEARCH" in plan, plan
+    if ordered:
+        assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,57 @@
+import json
+import pytest
+from app.services.json_stream import JsonArrayStreamParser
+
+RECOMMENDATION = {
+    "career_title": "Data Analyst",
+    "skill_gaps": [{"skill_name": "SQL"}],
+    "learning_roadmap": [{"phase": "Phase 1", "objectives": ["Learn SQL"]}]
+}
+
+def parse(text, chunk_size=None):
+    parser = JsonArrayStreamParser()
+    if chunk_size is None:
+        return parser.feed(text), parser
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start:start + chunk_size]))
+    return items, parser
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_top_level_array_of_objects(chunk_size):
+    text = "Here you go:\n```json\n" + json.dumps([RECOMMENDATION, RECOMMENDATION]) + "\n```"
+    items, parser = parse(text, chunk_size)
+    assert items == [RECOMMENDATION, RECOMMENDATION]
+    assert parser.finished
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_array_under_recommendations_key(chunk_size):
+    text = json.dumps({"summary": ["strong analytical profile"], "recommendations": [RECOMMENDATION]})
+    items, parser = parse(text, chunk_size)
+    assert items == [RECOMMENDATION]
+    assert parser.finished
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_nested_object_arrays_after_a_non_object_array_are_not_recommendations(chunk_size):
+    # The first array holds strings and the object arrays after it are
+    # nested inside other values; none of them is the payload
+    text = json.dumps(["Note: based on your quiz", RECOMMENDATION])
+    items, parser = parse(text, chunk_size)
+    assert items == []
+    assert not parser.finished
+
+    text = json.dumps({"notes": ["one", "two"], "best_match": RECOMMENDATION})
+    items, parser = parse(text, chunk_size)
+    assert items == []
+    assert not parser.finished
+
+def test_prose_in_brackets_before_the_array_is_skipped():
+    text = "Results [see below]:\n" + json.dumps([RECOMMENDATION])
+    items, parser = parse(text)
+    assert items == [RECOMMENDATION]
+    assert parser.finished
+
+def test_non_object_array_before_the_payload_is_skipped():
+    text = json.dumps(["Data Analyst"]) + "\n" + json.dumps([RECOMMENDATION])
+    items, parser = parse(text, 5)
+    assert items == [RECOMMENDATION]
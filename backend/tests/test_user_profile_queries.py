@@ -0,0 +1,53 @@
+from sqlalchemy import event
+from app.models import OnboardingData, QuizAnswer, QuizQuestion, User
+from app.services.gemini_service import GeminiService
+
+SECTIONS = ["personality", "skills", "interests", "work_preferences"]
+
+def seed_answers(db, user, count):
+    """Add ``count`` answered questions spread over every section"""
+    for index in range(count):
+        question = QuizQuestion(
+            section=SECTIONS[index % len(SECTIONS)],
+            question_text=f"Question {index}",
+            question_type="text",
+            order=index
+        )
+        db.add(question)
+        db.flush()
+        db.add(QuizAnswer(user_id=user.id, question_id=question.id, answer=f"Answer {index}"))
+    db.commit()
+
+def count_profile_statements(engine, db, user_id):
+    """Build the user's profile in a fresh session and count the SQL statements it runs"""
+    db.expunge_all()
+    user = db.get(User, user_id)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        profile = GeminiService.prepare_user_profile(db, user)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return profile, statements
+
+def test_prepare_user_profile_query_count_does_not_grow_with_answers(engine, db):
+    user = User(email="profile@example.com", hashed_password="x", full_name="Profile User")
+    db.add(user)
+    db.flush()
+    db.add(OnboardingData(user_id=user.id, field_of_study="Computer Science"))
+    db.commit()
+
+    seed_answers(db, user, 8)
+    profile, statements_for_n = count_profile_statements(engine, db, user.id)
+    assert sum(len(answers) for answers in profile["quiz_responses"].values()) == 8
+
+    seed_answers(db, user, 8)
+    profile, statements_for_2n = count_profile_statements(engine, db, user.id)
+    assert sum(len(answers) for answers in profile["quiz_responses"].values()) == 16
+
+    # One query for the onboarding row and one for every answer with its question
+    assert len(statements_for_n) == len(statements_for_2n) == 2